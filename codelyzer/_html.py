@@ -1,17 +1,44 @@
+import filecmp
+import functools
+import gzip
 import json
 import os
+import re
 import shutil
+from bisect import bisect_right
+from operator import attrgetter, itemgetter
 from datetime import datetime
+from itertools import islice
 from pathlib import Path
-from typing import Dict, Any, TypeVar, Literal, Optional
-
-from codelyzer.metrics import ProjectMetrics, SecurityLevel
+from string import Template
+from typing import Dict, Any, Iterator, List, TypeVar, Literal, Optional, Tuple, TextIO
+
+from codelyzer.metrics import FileMetrics, ProjectMetrics, SecurityLevel
+
+# orjson is an optional speedup for serializing the chart payload
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    orjson = None
+    ORJSON_AVAILABLE = False
+
+# brotli is optional; gzip is always available for precompressed reports
+try:
+    import brotli
+    BROTLI_AVAILABLE = True
+except ImportError:
+    brotli = None
+    BROTLI_AVAILABLE = False
 
 T = TypeVar('T', bound='ChartData')
 
 # Theme constants
 ThemeType = Literal["light", "dark"]
 
+# Encodings supported for precompressed reports
+CompressionType = Literal["gzip", "br"]
+
 class ThemeColors:
     """Theme color constants for report styling"""
     
@@ -121,6 +148,113 @@ class ThemeColors:
         "complexity_very_high": "bg-red-900 text-red-100",
     }
 
+
+# Fallback encoder, built once and reused; matches orjson's output with no whitespace
+# and no \u escaping of non-ASCII text. The chart data is plain nested dicts and
+# lists built here, so the circular reference check is skipped
+_JSON_ENCODER = json.JSONEncoder(separators=(",", ":"), ensure_ascii=False, check_circular=False)
+
+
+def _dumps(obj: Any) -> str:
+    """Serialize an object to a JSON string, using orjson when it is installed
+
+    Args:
+        obj: JSON-serializable object
+
+    Returns:
+        JSON encoded string
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj).decode()
+    return _JSON_ENCODER.encode(obj)
+
+
+# Blocks whose whitespace is significant and must survive minification
+_PRESERVED_BLOCK_PATTERN = re.compile(r'<(script|style|pre|textarea)\b.*?</\1>', re.DOTALL | re.IGNORECASE)
+_HTML_COMMENT_PATTERN = re.compile(r'<!--.*?-->', re.DOTALL)
+_WHITESPACE_PATTERN = re.compile(r'\s+')
+_CSS_COMMENT_PATTERN = re.compile(r'/\*.*?\*/', re.DOTALL)
+_CSS_PUNCTUATION_SPACE_PATTERN = re.compile(r'\s*([{};,>])\s*')
+
+
+def _minify_markup(markup: str) -> str:
+    """Drop comments and collapse whitespace runs in a plain markup segment."""
+    return _WHITESPACE_PATTERN.sub(" ", _HTML_COMMENT_PATTERN.sub("", markup))
+
+
+def minify_html(html: str) -> str:
+    """Collapse insignificant whitespace and comments in an HTML document.
+
+    Content of <script>, <style>, <pre> and <textarea> blocks is kept verbatim.
+
+    Args:
+        html: HTML document to minify
+
+    Returns:
+        Minified HTML document
+    """
+    parts = []
+    position = 0
+    for match in _PRESERVED_BLOCK_PATTERN.finditer(html):
+        parts.append(_minify_markup(html[position:match.start()]))
+        parts.append(match.group(0))
+        position = match.end()
+    parts.append(_minify_markup(html[position:]))
+    return "".join(parts).strip()
+
+
+def _minify_css(css: str) -> str:
+    """Strip comments and insignificant whitespace from a stylesheet.
+
+    Args:
+        css: Stylesheet source
+
+    Returns:
+        Minified stylesheet
+    """
+    css = _CSS_COMMENT_PATTERN.sub("", css)
+    css = _CSS_PUNCTUATION_SPACE_PATTERN.sub(r"\1", _WHITESPACE_PATTERN.sub(" ", css))
+    return css.replace(";}", "}").replace(": ", ":").strip()
+
+
+def _minify_js(script: str) -> str:
+    """Strip indentation, blank lines and whole-line // comments from a script.
+
+    Line breaks are kept so automatic semicolon insertion behaves as before;
+    the script must not contain string or template literals spanning lines.
+
+    Args:
+        script: JavaScript source, optionally wrapped in a <script> element
+
+    Returns:
+        Minified script
+    """
+    lines = (line.strip() for line in script.splitlines())
+    return "\n".join(line for line in lines if line and not line.startswith("//"))
+
+
+def _split_at_slots(markup: str, *slots: str) -> Tuple[str, ...]:
+    """Split static markup at its $slot placeholders so it can be rendered with a join.
+
+    Args:
+        markup: Markup containing each slot exactly once
+        *slots: Slot names in the order they appear in the markup
+
+    Returns:
+        The static fragments around the slots, one more than there are slots
+    """
+    fragments = []
+    for slot in slots:
+        fragment, markup = markup.split("$" + slot, 1)
+        fragments.append(fragment)
+    fragments.append(markup)
+    return tuple(fragments)
+
+
+# Path to the favicon in the assets directory
+_FAVICON_SOURCE = Path(__file__).parent.parent / "assets" / "favicon.png"
+
+
 # Function to copy favicon to output directory
 def copy_favicon_to_output(output_dir: str) -> str:
     """
@@ -136,14 +270,14 @@ def copy_favicon_to_output(output_dir: str) -> str:
     assets_dir = Path(output_dir) / "assets" / "static"
     assets_dir.mkdir(parents=True, exist_ok=True)
     
-    # Path to the favicon in the assets directory
-    src_favicon_path = Path(__file__).parent.parent / "assets" / "favicon.png"
-    
     # Path to the destination favicon
     dest_favicon_path = assets_dir / "favicon.png"
     
-    # Copy the favicon file
-    shutil.copy2(src_favicon_path, dest_favicon_path)
+    # Copy the favicon file unless a previous report already put the same one there.
+    # copy2 keeps the source mtime, so later runs match on size and mtime alone
+    # and only fall back to comparing contents when those differ
+    if not dest_favicon_path.exists() or not filecmp.cmp(_FAVICON_SOURCE, dest_favicon_path, shallow=True):
+        shutil.copy2(_FAVICON_SOURCE, dest_favicon_path)
     
     # Return the relative path to be used in HTML
     return "assets/static/favicon.png"
@@ -156,6 +290,19 @@ class ReportComponent:
         """Render the HTML component"""
         return ""
 
+    @classmethod
+    def render_into(cls, metrics: 'ProjectMetrics', out: List[str]) -> None:
+        """Append the HTML component to a shared list of report fragments.
+
+        Components precompiled into static fragments override this to append
+        those fragments directly instead of joining them into a string first.
+
+        Args:
+            metrics: ProjectMetrics object containing analysis data
+            out: Report fragments, joined or written out by the caller
+        """
+        out.append(cls.render(metrics))
+
 
 class TableComponent(ReportComponent):
     """Base class for table components"""
@@ -173,15 +320,91 @@ class TableComponent(ReportComponent):
         return ""
 
 
+# Type alias for the pre-aggregated per-chart counters
+AggregatedCounts = Dict[str, Dict[str, int]]
+
+# Complexity buckets: scores below the first threshold are "Low", and so on
+_COMPLEXITY_THRESHOLDS = (10, 20, 30)
+_COMPLEXITY_LABELS = ("Low", "Medium", "High", "Very High")
+
+# Severity buckets, ordered from most to least severe. An issue lands in the
+# most severe bucket matched by either its level or its severity string.
+_SECURITY_LABELS = ("Critical", "High", "Medium", "Low")
+_SECURITY_COLORS = ("#ef4444", "#f97316", "#eab308", "#22c55e")
+_SECURITY_LEVEL_RANKS = {
+    SecurityLevel.CRITICAL: 0,
+    SecurityLevel.HIGH_RISK: 1,
+    SecurityLevel.MEDIUM_RISK: 2
+}
+_SECURITY_SEVERITY_RANKS = {
+    'critical': 0,
+    'high': 1,
+    'medium': 2
+}
+
+_SMELL_LABELS = ("Critical", "Major", "Minor")
+_SMELL_COLORS = ("#ef4444", "#f97316", "#22c55e")
+_SMELL_SEVERITY_RANKS = {
+    'critical': 0,
+    'major': 1
+}
+
+
+def _aggregate_counts(metrics: 'ProjectMetrics') -> AggregatedCounts:
+    """Count complexity buckets, security issues and code smells in a single pass
+
+    Walking ``metrics.file_metrics`` once and filling every counter at the same
+    time avoids re-traversing the file list for each chart.
+
+    Args:
+        metrics: ProjectMetrics object containing analysis data
+
+    Returns:
+        Dictionary mapping chart ids to their label->count dictionaries
+    """
+    complexity_counts = [0] * len(_COMPLEXITY_LABELS)
+    security_counts = [0] * len(_SECURITY_LABELS)
+    smell_counts = [0] * len(_SMELL_LABELS)
+    lowest_security_rank = len(_SECURITY_LABELS) - 1
+    lowest_smell_rank = len(_SMELL_LABELS) - 1
+
+    # Bind the lookups used per file and per issue to locals once
+    thresholds = _COMPLEXITY_THRESHOLDS
+    level_rank_of = _SECURITY_LEVEL_RANKS.get
+    severity_rank_of = _SECURITY_SEVERITY_RANKS.get
+    smell_rank_of = _SMELL_SEVERITY_RANKS.get
+    default_level = SecurityLevel.MEDIUM_RISK
+
+    for file_metric in metrics.file_metrics:
+        # Read the metric categories directly; the FileMetrics shortcut
+        # properties cost an extra Python call on every access
+        complexity_counts[bisect_right(thresholds, file_metric.complexity.complexity_score)] += 1
+
+        for issue in file_metric.security.vulnerabilities:
+            level_rank = level_rank_of(issue.get('level', default_level), lowest_security_rank)
+            severity_rank = severity_rank_of(issue.get('severity', 'medium').lower(), lowest_security_rank)
+            security_counts[min(level_rank, severity_rank)] += 1
+
+        for smell in file_metric.code_smells.smells:
+            smell_counts[smell_rank_of(smell.get('severity', 'minor').lower(), lowest_smell_rank)] += 1
+
+    return {
+        "complexity": dict(zip(_COMPLEXITY_LABELS, complexity_counts)),
+        "security": dict(zip(_SECURITY_LABELS, security_counts)),
+        "code_smells": dict(zip(_SMELL_LABELS, smell_counts))
+    }
+
+
 class ChartData:
     """Base class for chart data preparation"""
 
     @staticmethod
-    def prepare_data(metrics: 'ProjectMetrics') -> Dict[str, Any]:
+    def prepare_data(metrics: 'ProjectMetrics', counts: Optional[AggregatedCounts] = None) -> Dict[str, Any]:
         """Prepare data for a chart
         
         Args:
             metrics: ProjectMetrics object containing analysis data
+            counts: Optional counters pre-aggregated by ``_aggregate_counts``
             
         Returns:
             Dictionary with prepared data for chart
@@ -193,28 +416,26 @@ class LanguageChartData(ChartData):
     """Language distribution chart data"""
 
     @staticmethod
-    def prepare_data(metrics: 'ProjectMetrics', *args, **kwargs) -> Dict[str, Any]:
+    def prepare_data(metrics: 'ProjectMetrics', counts: Optional[AggregatedCounts] = None) -> Dict[str, Any]:
         """Prepare language distribution data
         
         Args:
             metrics: ProjectMetrics object containing analysis data
+            counts: Unused; the language totals come straight from the metrics
             
         Returns:
             Dictionary with language labels and values
         """
         languages = metrics.language_distribution
-        labels = list(languages.keys())
-        values = list(languages.values())
+        if not languages:
+            return {"labels": [], "values": []}
 
         # Sort by value in descending order for better visualization
-        sorted_data = sorted(zip(labels, values), key=lambda x: x[1], reverse=True)
-
-        # Unpack the sorted data
-        sorted_labels, sorted_values = zip(*sorted_data) if sorted_data else ([], [])
+        sorted_items = sorted(languages.items(), key=itemgetter(1), reverse=True)
 
         return {
-            "labels": list(sorted_labels),
-            "values": list(sorted_values)
+            "labels": [label for label, _ in sorted_items],
+            "values": [value for _, value in sorted_items]
         }
 
 
@@ -222,32 +443,19 @@ class ComplexityChartData(ChartData):
     """Complexity distribution chart data"""
 
     @staticmethod
-    def prepare_data(metrics: 'ProjectMetrics') -> Dict[str, Any]:
+    def prepare_data(metrics: 'ProjectMetrics', counts: Optional[AggregatedCounts] = None) -> Dict[str, Any]:
         """Prepare complexity distribution data
         
         Args:
             metrics: ProjectMetrics object containing analysis data
+            counts: Optional counters pre-aggregated by ``_aggregate_counts``
             
         Returns:
             Dictionary with complexity labels and values
         """
-        complexity_counts = {
-            "Low": 0,
-            "Medium": 0,
-            "High": 0,
-            "Very High": 0
-        }
-
-        for file_metric in metrics.file_metrics:
-            complexity_score = file_metric.complexity_score
-            if complexity_score < 10:
-                complexity_counts["Low"] += 1
-            elif complexity_score < 20:
-                complexity_counts["Medium"] += 1
-            elif complexity_score < 30:
-                complexity_counts["High"] += 1
-            else:
-                complexity_counts["Very High"] += 1
+        if counts is None:
+            counts = _aggregate_counts(metrics)
+        complexity_counts = counts["complexity"]
 
         return {
             "labels": list(complexity_counts.keys()),
@@ -259,40 +467,24 @@ class SecurityIssuesChartData(ChartData):
     """Security issues chart data"""
 
     @staticmethod
-    def prepare_data(metrics: 'ProjectMetrics') -> Dict[str, Any]:
+    def prepare_data(metrics: 'ProjectMetrics', counts: Optional[AggregatedCounts] = None) -> Dict[str, Any]:
         """Prepare security issues data
         
         Args:
             metrics: ProjectMetrics object containing analysis data
+            counts: Optional counters pre-aggregated by ``_aggregate_counts``
             
         Returns:
             Dictionary with security issue severity labels and values
         """
-        security_counts = {
-            "Critical": 0,
-            "High": 0,
-            "Medium": 0,
-            "Low": 0
-        }
-
-        for file_metric in metrics.file_metrics:
-            for issue in file_metric.security_issues:
-                level = issue.get('level', SecurityLevel.MEDIUM_RISK)
-                severity = issue.get('severity', 'medium').lower()
-
-                if level == SecurityLevel.CRITICAL or severity == 'critical':
-                    security_counts["Critical"] += 1
-                elif level == SecurityLevel.HIGH_RISK or severity == 'high':
-                    security_counts["High"] += 1
-                elif level == SecurityLevel.MEDIUM_RISK or severity == 'medium':
-                    security_counts["Medium"] += 1
-                else:
-                    security_counts["Low"] += 1
+        if counts is None:
+            counts = _aggregate_counts(metrics)
+        security_counts = counts["security"]
 
         return {
             "labels": list(security_counts.keys()),
             "values": list(security_counts.values()),
-            "colors": ["#ef4444", "#f97316", "#eab308", "#22c55e"]
+            "colors": list(_SECURITY_COLORS)
         }
 
 
@@ -300,39 +492,90 @@ class CodeSmellsChartData(ChartData):
     """Code smells chart data"""
 
     @staticmethod
-    def prepare_data(metrics: 'ProjectMetrics') -> Dict[str, Any]:
+    def prepare_data(metrics: 'ProjectMetrics', counts: Optional[AggregatedCounts] = None) -> Dict[str, Any]:
         """Prepare code smells data
         
         Args:
             metrics: ProjectMetrics object containing analysis data
+            counts: Optional counters pre-aggregated by ``_aggregate_counts``
             
         Returns:
             Dictionary with code smell severity labels and values
         """
-        smell_counts = {
-            "Critical": 0,
-            "Major": 0,
-            "Minor": 0
-        }
-
-        for file_metric in metrics.file_metrics:
-            for smell in file_metric.code_smells_list:
-                severity = smell.get('severity', 'minor').lower()
-
-                if severity == 'critical':
-                    smell_counts["Critical"] += 1
-                elif severity == 'major':
-                    smell_counts["Major"] += 1
-                else:
-                    smell_counts["Minor"] += 1
+        if counts is None:
+            counts = _aggregate_counts(metrics)
+        smell_counts = counts["code_smells"]
 
         return {
             "labels": list(smell_counts.keys()),
             "values": list(smell_counts.values()),
-            "colors": ["#ef4444", "#f97316", "#22c55e"]
+            "colors": list(_SMELL_COLORS)
         }
 
 
+# Table classes repeated across the header, row and placeholder templates
+_HEADER_CELL_CLASSES = "px-6 py-3 border-b-2 border-gray-300 dark:border-gray-700 text-left text-xs font-semibold text-gray-600 dark:text-gray-400 uppercase tracking-wider"
+_CELL_CLASSES = "px-6 py-4 border-b border-gray-200 dark:border-gray-700"
+_ROW_CLASSES = "hover:bg-gray-50 dark:hover:bg-gray-800 hover:scale-[1.005] transition-all duration-200"
+_NAME_CHIP_CLASSES = "flex items-center gap-2 font-mono text-sm text-gray-600 dark:text-gray-400 max-w-xs overflow-hidden text-ellipsis whitespace-nowrap bg-gray-50 dark:bg-gray-800 px-2 py-1 rounded border border-gray-200 dark:border-gray-700"
+
+
+# Static table header for the complex files table
+_COMPLEX_FILES_TABLE_HEAD = minify_html(f'''<thead>
+                        <tr>
+                            <th class="{_HEADER_CELL_CLASSES}">File</th>
+                            <th class="{_HEADER_CELL_CLASSES} sortable cursor-pointer hover:bg-gray-50 dark:hover:bg-gray-800" data-sort="loc">
+                                LOC
+                                <i class="fas fa-sort ml-1 text-gray-400"></i>
+                            </th>
+                            <th class="{_HEADER_CELL_CLASSES} sortable cursor-pointer hover:bg-gray-50 dark:hover:bg-gray-800" data-sort="complexity">
+                                Complexity
+                                <i class="fas fa-sort-down ml-1 text-blue-500"></i>
+                            </th>
+                            <th class="{_HEADER_CELL_CLASSES}">Issues</th>
+                        </tr>
+                    </thead>''')
+
+
+# Complexity badge classes, indexed by complexity bucket (see _COMPLEXITY_THRESHOLDS)
+_COMPLEXITY_BADGES = tuple(
+    ThemeColors.LIGHT[key] + " dark:" + ThemeColors.DARK[key]
+    for key in ("complexity_low", "complexity_medium", "complexity_high", "complexity_very_high")
+)
+
+
+# Row markup for the complex files table, filled in with str.format per row
+_COMPLEX_FILE_ROW_TEMPLATE = minify_html(f'''
+        <tr class="{_ROW_CLASSES}" data-complexity="{{complexity_score}}" data-loc="{{sloc}}">
+            <td class="{_CELL_CLASSES}">
+                <div class="{_NAME_CHIP_CLASSES}" title="{{relative_path}}">
+                    <i class="fas fa-file-code" aria-hidden="true"></i>
+                    {{relative_path}}
+                </div>
+            </td>
+            <td class="{_CELL_CLASSES}"><span class="font-semibold text-gray-900 dark:text-gray-100 tabular-nums">{{sloc:,}}</span></td>
+            <td class="{_CELL_CLASSES}"><span class="inline-flex items-center px-3 py-1 rounded-lg text-xs font-medium uppercase tracking-wide {{complexity_badge}}">{{complexity_score:.0f}}</span></td>
+            <td class="{_CELL_CLASSES}">{{issues_display}}</td>
+        </tr>''')
+
+# Complex files table shell with its static header, compiled once at import time
+_COMPLEX_FILES_TABLE_TEMPLATE = Template(minify_html(f'''
+        <div class="bg-card p-6 rounded-2xl shadow-md border border-theme h-full">
+            <h3 class="text-lg font-semibold mb-4 flex items-center gap-2 text-body">
+                <i class="fas fa-exclamation-triangle text-orange-500" aria-hidden="true"></i> 
+                Most Complex Files
+            </h3>
+            <div class="overflow-x-auto">
+                <table class="min-w-full complex-files-table" id="complex-files-table">
+                    {_COMPLEX_FILES_TABLE_HEAD}
+                    <tbody>
+                        $rows
+                    </tbody>
+                </table>
+            </div>
+        </div>'''))
+
+
 class ComplexFilesTableComponent(TableComponent):
     """Complex files table component"""
 
@@ -346,47 +589,34 @@ class ComplexFilesTableComponent(TableComponent):
         Returns:
             HTML string for the complex files table
         """
-        rows = ""
+        row_parts = []
 
-        # Create a mapping of file paths to file metrics for quick lookup
-        file_metrics_map = {fm.file_path: fm for fm in metrics.file_metrics}
-        
         # Ensure we have the most complex files
         # If most_complex_files is empty or doesn't have enough entries, recreate it based on complexity score
         if len(metrics.most_complex_files) < 15:
-            # Sort files by complexity score in descending order
-            sorted_files = sorted(metrics.file_metrics, key=lambda f: f.complexity_score, reverse=True)
-            most_complex = [f.file_path for f in sorted_files[:15]]
-            
-            # Use these sorted files for display
-            display_files = most_complex
+            # Select the top files by complexity score in descending order
+            display_metrics = metrics.top_complex_files(15)
         else:
             # Use the existing most_complex_files but ensure we only show the top 15
             display_files = metrics.most_complex_files[:15]
+            display_metrics = ComplexFilesTableComponent._find_file_metrics(metrics, display_files)
 
-        # Loop through the most complex file paths and find corresponding FileMetrics objects
-        for file_path in display_files:
-            # Get the FileMetrics object for this file path
-            file_metrics = file_metrics_map.get(file_path)
-
-            if not file_metrics:
-                continue
+        # Resolve loop invariants once rather than per row; the trailing
+        # separator keeps "/a/b" from matching inside "/a/bc/file.py"
+        cwd_prefix = os.path.join(os.getcwd(), "")
+        format_row = _COMPLEX_FILE_ROW_TEMPLATE.format
 
+        # Loop through the most complex files
+        for file_metrics in display_metrics:
             # Extract the relative path
-            relative_path = file_path.replace(os.getcwd(), "").lstrip(os.sep).replace("\\", "/")
+            relative_path = file_metrics.file_path.removeprefix(cwd_prefix).replace("\\", "/")
 
             # Count issues
             issues = len(file_metrics.security_issues) + len(file_metrics.code_smells_list)
 
             # Get complexity badge class based on score
-            if file_metrics.complexity_score >= 30:
-                complexity_badge = ThemeColors.LIGHT["complexity_very_high"] + " dark:" + ThemeColors.DARK["complexity_very_high"]
-            elif file_metrics.complexity_score >= 20:
-                complexity_badge = ThemeColors.LIGHT["complexity_high"] + " dark:" + ThemeColors.DARK["complexity_high"]
-            elif file_metrics.complexity_score >= 10:
-                complexity_badge = ThemeColors.LIGHT["complexity_medium"] + " dark:" + ThemeColors.DARK["complexity_medium"]
-            else:
-                complexity_badge = ThemeColors.LIGHT["complexity_low"] + " dark:" + ThemeColors.DARK["complexity_low"]
+            complexity_score = file_metrics.complexity_score
+            complexity_badge = _COMPLEXITY_BADGES[bisect_right(_COMPLEXITY_THRESHOLDS, complexity_score)]
 
             # Format issues display
             if issues > 0:
@@ -395,48 +625,91 @@ class ComplexFilesTableComponent(TableComponent):
                 issues_display = '<span class="text-green-600 dark:text-green-400">0</span>'
 
             # Add data attributes for sorting
-            rows += f'''
-        <tr class="hover:bg-gray-50 dark:hover:bg-gray-800 hover:scale-[1.005] transition-all duration-200" data-complexity="{file_metrics.complexity_score}" data-loc="{file_metrics.sloc}">
-            <td class="px-6 py-4 border-b border-gray-200 dark:border-gray-700">
-                <div class="flex items-center gap-2 font-mono text-sm text-gray-600 dark:text-gray-400 max-w-xs overflow-hidden text-ellipsis whitespace-nowrap bg-gray-50 dark:bg-gray-800 px-2 py-1 rounded border border-gray-200 dark:border-gray-700" title="{relative_path}">
-                    <i class="fas fa-file-code" aria-hidden="true"></i>
-                    {relative_path}
-                </div>
-            </td>
-            <td class="px-6 py-4 border-b border-gray-200 dark:border-gray-700"><span class="font-semibold text-gray-900 dark:text-gray-100 tabular-nums">{file_metrics.sloc:,}</span></td>
-            <td class="px-6 py-4 border-b border-gray-200 dark:border-gray-700"><span class="inline-flex items-center px-3 py-1 rounded-lg text-xs font-medium uppercase tracking-wide {complexity_badge}">{file_metrics.complexity_score:.0f}</span></td>
-            <td class="px-6 py-4 border-b border-gray-200 dark:border-gray-700">{issues_display}</td>
-        </tr>'''
+            row_parts.append(format_row(
+                relative_path=relative_path,
+                sloc=file_metrics.sloc,
+                complexity_score=complexity_score,
+                complexity_badge=complexity_badge,
+                issues_display=issues_display
+            ))
+        rows = "".join(row_parts)
 
-        # Add sortable class and click handlers to the table headers
-        return f'''
+        return _COMPLEX_FILES_TABLE_TEMPLATE.substitute(rows=rows)
+
+    @staticmethod
+    def _find_file_metrics(metrics: 'ProjectMetrics', file_paths: List[str]) -> List['FileMetrics']:
+        """Look up the FileMetrics for the given paths, keeping their order.
+
+        Only the requested paths are indexed, and the scan stops as soon as all
+        of them have been found.
+
+        Args:
+            metrics: ProjectMetrics object containing analysis data
+            file_paths: Paths of the files to look up
+
+        Returns:
+            FileMetrics objects for the paths that were found
+        """
+        wanted = set(file_paths)
+        file_metrics_map = {}
+        for file_metrics in metrics.file_metrics:
+            if file_metrics.file_path in wanted:
+                file_metrics_map[file_metrics.file_path] = file_metrics
+                if len(file_metrics_map) == len(wanted):
+                    break
+
+        return [file_metrics_map[path] for path in file_paths if path in file_metrics_map]
+
+
+# Static table header for the dependencies table
+_DEPENDENCIES_TABLE_HEAD = minify_html(f'''<thead>
+                        <tr>
+                            <th class="{_HEADER_CELL_CLASSES}">Name</th>
+                            <th class="{_HEADER_CELL_CLASSES}">Version</th>
+                            <th class="{_HEADER_CELL_CLASSES}">License</th>
+                        </tr>
+                    </thead>''')
+
+
+# Row markup for the dependencies table, filled in with str.format per row
+_DEPENDENCY_ROW_TEMPLATE = minify_html(f'''
+                <tr class="{_ROW_CLASSES}">
+                    <td class="{_CELL_CLASSES}">
+                        <div class="{_NAME_CHIP_CLASSES}">
+                            <i class="fas fa-cubes" aria-hidden="true"></i>
+                            {{name}}
+                        </div>
+                    </td>
+                    <td class="{_CELL_CLASSES}"><span class="font-semibold text-gray-900 dark:text-gray-100">{{count}}</span></td>
+                    <td class="{_CELL_CLASSES}">
+                        <span class="text-gray-400 dark:text-gray-500">-</span>
+                    </td>
+                </tr>''')
+
+# Placeholder row shown when dependency data is missing or can't be processed
+_EMPTY_DEPENDENCY_ROW = minify_html(f'''
+            <tr>
+                <td class="{_CELL_CLASSES}" colspan="3">
+                    <div class="text-center text-muted">No dependency information available</div>
+                </td>
+            </tr>''')
+
+# Dependencies table shell with its static header, compiled once at import time
+_DEPENDENCIES_TABLE_TEMPLATE = Template(minify_html(f'''
         <div class="bg-card p-6 rounded-2xl shadow-md border border-theme h-full">
             <h3 class="text-lg font-semibold mb-4 flex items-center gap-2 text-body">
-                <i class="fas fa-exclamation-triangle text-orange-500" aria-hidden="true"></i> 
-                Most Complex Files
+                <i class="fas fa-cubes text-blue-500" aria-hidden="true"></i> 
+                Dependencies
             </h3>
             <div class="overflow-x-auto">
-                <table class="min-w-full complex-files-table" id="complex-files-table">
-                    <thead>
-                        <tr>
-                            <th class="px-6 py-3 border-b-2 border-gray-300 dark:border-gray-700 text-left text-xs font-semibold text-gray-600 dark:text-gray-400 uppercase tracking-wider">File</th>
-                            <th class="px-6 py-3 border-b-2 border-gray-300 dark:border-gray-700 text-left text-xs font-semibold text-gray-600 dark:text-gray-400 uppercase tracking-wider sortable cursor-pointer hover:bg-gray-50 dark:hover:bg-gray-800" data-sort="loc">
-                                LOC
-                                <i class="fas fa-sort ml-1 text-gray-400"></i>
-                            </th>
-                            <th class="px-6 py-3 border-b-2 border-gray-300 dark:border-gray-700 text-left text-xs font-semibold text-gray-600 dark:text-gray-400 uppercase tracking-wider sortable cursor-pointer hover:bg-gray-50 dark:hover:bg-gray-800" data-sort="complexity">
-                                Complexity
-                                <i class="fas fa-sort-down ml-1 text-blue-500"></i>
-                            </th>
-                            <th class="px-6 py-3 border-b-2 border-gray-300 dark:border-gray-700 text-left text-xs font-semibold text-gray-600 dark:text-gray-400 uppercase tracking-wider">Issues</th>
-                        </tr>
-                    </thead>
+                <table class="min-w-full">
+                    {_DEPENDENCIES_TABLE_HEAD}
                     <tbody>
-                        {rows}
+                        $rows
                     </tbody>
                 </table>
             </div>
-        </div>'''
+        </div>'''))
 
 
 class DependenciesTableComponent(TableComponent):
@@ -467,12 +740,12 @@ class DependenciesTableComponent(TableComponent):
         """
         # Check if dependencies exist and are structured as expected
         if not DependenciesTableComponent._has_valid_dependencies(metrics):
-            return DependenciesTableComponent._create_empty_row()
+            return _EMPTY_DEPENDENCY_ROW
 
         try:
             return DependenciesTableComponent._format_dependency_rows(metrics.structure.dependencies)
         except Exception:
-            return DependenciesTableComponent._create_error_row()
+            return _EMPTY_DEPENDENCY_ROW
 
     @staticmethod
     def _has_valid_dependencies(metrics: 'ProjectMetrics') -> bool:
@@ -496,50 +769,11 @@ class DependenciesTableComponent(TableComponent):
         Returns:
             HTML string with formatted rows
         """
-        rows = ""
-        for name, count in list(dependencies.items())[:15]:  # Limit to 15 items
-            rows += f'''
-                <tr class="hover:bg-gray-50 dark:hover:bg-gray-800 hover:scale-[1.005] transition-all duration-200">
-                    <td class="px-6 py-4 border-b border-gray-200 dark:border-gray-700">
-                        <div class="flex items-center gap-2 font-mono text-sm text-gray-600 dark:text-gray-400 max-w-xs overflow-hidden text-ellipsis whitespace-nowrap bg-gray-50 dark:bg-gray-800 px-2 py-1 rounded border border-gray-200 dark:border-gray-700">
-                            <i class="fas fa-cubes" aria-hidden="true"></i>
-                            {name}
-                        </div>
-                    </td>
-                    <td class="px-6 py-4 border-b border-gray-200 dark:border-gray-700"><span class="font-semibold text-gray-900 dark:text-gray-100">{count}</span></td>
-                    <td class="px-6 py-4 border-b border-gray-200 dark:border-gray-700">
-                        <span class="text-gray-400 dark:text-gray-500">-</span>
-                    </td>
-                </tr>'''
-        return rows
-
-    @staticmethod
-    def _create_empty_row() -> str:
-        """Create a placeholder row when no dependencies exist
-        
-        Returns:
-            HTML string for empty state
-        """
-        return '''
-            <tr>
-                <td class="px-6 py-4 border-b border-gray-200 dark:border-gray-700" colspan="3">
-                    <div class="text-center text-muted">No dependency information available</div>
-                </td>
-            </tr>'''
-
-    @staticmethod
-    def _create_error_row() -> str:
-        """Create a placeholder row when an error occurs processing dependencies
-        
-        Returns:
-            HTML string for error state
-        """
-        return '''
-                <tr>
-                    <td class="px-6 py-4 border-b border-gray-200 dark:border-gray-700" colspan="3">
-                        <div class="text-center text-muted">No dependency information available</div>
-                    </td>
-                </tr>'''
+        row_parts = []
+        format_row = _DEPENDENCY_ROW_TEMPLATE.format
+        for name, count in islice(dependencies.items(), 15):  # Limit to 15 items
+            row_parts.append(format_row(name=name, count=count))
+        return "".join(row_parts)
 
     @staticmethod
     def _create_dependencies_table(rows: str) -> str:
@@ -551,41 +785,82 @@ class DependenciesTableComponent(TableComponent):
         Returns:
             Complete HTML table with container
         """
-        return f'''
-        <div class="bg-card p-6 rounded-2xl shadow-md border border-theme h-full">
-            <h3 class="text-lg font-semibold mb-4 flex items-center gap-2 text-body">
-                <i class="fas fa-cubes text-blue-500" aria-hidden="true"></i> 
-                Dependencies
+        return _DEPENDENCIES_TABLE_TEMPLATE.substitute(rows=rows)
+
+
+# Chart card icons and container shell, built once at import time
+_CHART_ICONS = {
+    'languages': '<i class="fas fa-code text-blue-500 animate-icon-pulse" aria-hidden="true"></i>',
+    'complexity': '<i class="fas fa-layer-group text-orange-500 animate-icon-pulse" aria-hidden="true"></i>',
+    'security': '<i class="fas fa-shield-alt text-red-500 animate-icon-pulse" aria-hidden="true"></i>',
+    'code_smells': '<i class="fas fa-bug text-purple-500 animate-icon-pulse" aria-hidden="true"></i>'
+}
+_DEFAULT_CHART_ICON = '<i class="fas fa-chart-pie text-blue-500 animate-icon-pulse" aria-hidden="true"></i>'
+
+# Decorative hover markup for each chart card
+_CHART_HOVER_EFFECTS = {
+    'languages': '''
+                <div class="absolute -top-1 -right-1 w-2 h-2 bg-blue-400 rounded-full opacity-0 group-hover:opacity-100 transition-all duration-500 group-hover:animate-ping" style="animation-delay: 0.1s;"></div>
+                <div class="absolute top-1 right-1 w-1.5 h-1.5 bg-green-400 rounded-full opacity-0 group-hover:opacity-100 transition-all duration-500 group-hover:animate-ping" style="animation-delay: 0.2s;"></div>
+                <div class="absolute -bottom-1 right-2 w-1 h-1 bg-yellow-400 rounded-full opacity-0 group-hover:opacity-100 transition-all duration-500 group-hover:animate-ping" style="animation-delay: 0.3s;"></div>
+            ''',
+    'complexity': '''
+                <div class="absolute bottom-0 left-0 h-1 bg-gradient-to-r from-green-500 via-yellow-500 to-red-500 transform origin-left scale-x-0 group-hover:scale-x-100 transition-transform duration-1000 ease-out"></div>
+            ''',
+    'security': '''
+                <div class="absolute inset-0 rounded-2xl border-2 border-red-500/0 group-hover:border-red-500/20 transition-all duration-500"></div>
+                <div class="absolute top-4 right-4 opacity-0 group-hover:opacity-30 transition-opacity duration-500">
+                    <div class="w-10 h-0.5 bg-red-500/50 group-hover:animate-pulse"></div>
+                    <div class="w-7 h-0.5 bg-red-500/30 mt-1 group-hover:animate-pulse" style="animation-delay: 0.2s;"></div>
+                    <div class="w-4 h-0.5 bg-red-500/20 mt-1 group-hover:animate-pulse" style="animation-delay: 0.4s;"></div>
+                </div>
+            ''',
+    'code_smells': '''
+                <div class="absolute inset-0 bg-purple-500/5 opacity-0 group-hover:opacity-100 transition-opacity duration-700 rounded-2xl group-hover:animate-pulse"></div>
+                <div class="absolute bottom-0 left-0 h-1 bg-gradient-to-r from-purple-600 via-purple-400 to-purple-600 transform origin-left scale-x-0 group-hover:scale-x-100 transition-transform duration-1200 ease-in-out"></div>
+            '''
+}
+_DEFAULT_CHART_HOVER_EFFECT = '''
+            <div class="absolute bottom-0 left-0 h-1 bg-gradient-to-r from-blue-500 to-blue-300 transform origin-left scale-x-0 group-hover:scale-x-100 transition-transform duration-1000 ease-out"></div>
+        '''
+
+# (chart id, title, chart type) for each chart in display order
+_CHARTS = (
+    ('languages', 'Language Distribution', 'doughnut'),
+    ('complexity', 'Complexity Distribution', 'bar'),
+    ('security', 'Security Issues', 'bar'),
+    ('code_smells', 'Code Smells', 'bar'),
+)
+
+_CHART_CONTAINER_TEMPLATE = Template('''
+        <div class="stat-card card-3d-effect bg-card p-6 rounded-2xl shadow-md border border-theme h-full transition-all duration-500 hover:shadow-xl relative overflow-hidden group hover:scale-105">
+            <h3 class="text-lg font-semibold mb-4 flex items-center gap-2 text-body transition-all duration-300 group-hover:translate-x-2">
+                $icon 
+                <span class="transition-all duration-300 group-hover:text-blue-500">$title</span>
             </h3>
-            <div class="overflow-x-auto">
-                <table class="min-w-full">
-                    <thead>
-                        <tr>
-                            <th class="px-6 py-3 border-b-2 border-gray-300 dark:border-gray-700 text-left text-xs font-semibold text-gray-600 dark:text-gray-400 uppercase tracking-wider">Name</th>
-                            <th class="px-6 py-3 border-b-2 border-gray-300 dark:border-gray-700 text-left text-xs font-semibold text-gray-600 dark:text-gray-400 uppercase tracking-wider">Version</th>
-                            <th class="px-6 py-3 border-b-2 border-gray-300 dark:border-gray-700 text-left text-xs font-semibold text-gray-600 dark:text-gray-400 uppercase tracking-wider">License</th>
-                        </tr>
-                    </thead>
-                    <tbody>
-                        {rows}
-                    </tbody>
-                </table>
+            $hover_effect
+            <div class="h-64 w-full relative z-10 card-inner">
+                <canvas id="chart-$chart_id" class="transition-all duration-500 group-hover:scale-105"></canvas>
             </div>
-        </div>'''
+        </div>''')
 
 
 class PlotReportGenerator:
     """Generate chart visualizations for the HTML report."""
 
+    __slots__ = ('charts_data',)
+
+    # (chart id, data class) for every chart, shared by all instances
+    _CHART_CLASSES = (
+        ('languages', LanguageChartData),
+        ('complexity', ComplexityChartData),
+        ('security', SecurityIssuesChartData),
+        ('code_smells', CodeSmellsChartData),
+    )
+
     def __init__(self) -> None:
         """Initialize the plot report generator."""
         self.charts_data: Dict[str, Dict[str, Any]] = {}
-        self.chart_classes = {
-            'languages': LanguageChartData,
-            'complexity': ComplexityChartData,
-            'security': SecurityIssuesChartData,
-            'code_smells': CodeSmellsChartData
-        }
 
     def prepare_chart_data(self, metrics: 'ProjectMetrics') -> None:
         """Prepare all charts data for plotting.
@@ -593,8 +868,15 @@ class PlotReportGenerator:
         Args:
             metrics: ProjectMetrics object containing analysis data
         """
-        for chart_id, chart_class in self.chart_classes.items():
-            self.charts_data[chart_id] = chart_class.prepare_data(metrics)
+        # Walk the file metrics once and share the counters with every chart
+        counts = _aggregate_counts(metrics)
+        for chart_id, chart_class in self._CHART_CLASSES:
+            data = chart_class.prepare_data(metrics, counts)
+            # Charts with nothing to plot stay out of the payload; the report drops their cards
+            if any(data.get("values", ())):
+                self.charts_data[chart_id] = data
+            else:
+                self.charts_data.pop(chart_id, None)
 
     def get_charts_grid_html(self) -> str:
         """Get the HTML grid for all charts.
@@ -602,86 +884,53 @@ class PlotReportGenerator:
         Returns:
             HTML string for the charts grid
         """
+        return _CHARTS_GRID_HTML
+
+    @staticmethod
+    def _render_charts_grid_html() -> str:
+        """Render the HTML grid holding a container for every chart.
+
+        Returns:
+            HTML string for the charts grid
+        """
+        containers = "\n            ".join(
+            PlotReportGenerator._get_chart_container_html(chart_id, title)
+            for chart_id, title, _ in _CHARTS
+        )
         return f'''
         <div class="grid grid-cols-1 md:grid-cols-2 gap-6 mb-10 fade-in">
-            {self._get_chart_container_html('languages', 'Language Distribution', 'doughnut')}
-            {self._get_chart_container_html('complexity', 'Complexity Distribution', 'bar')}
-            {self._get_chart_container_html('security', 'Security Issues', 'bar')}
-            {self._get_chart_container_html('code_smells', 'Code Smells', 'bar')}
+            {containers}
         </div>'''
 
     @staticmethod
-    def _get_chart_container_html(chart_id: str, title: str, chart_type: str) -> str:
+    def _get_chart_container_html(chart_id: str, title: str) -> str:
         """Get the HTML container for a single chart.
         
         Args:
             chart_id: Unique identifier for the chart
             title: Title to display above the chart
-            chart_type: Type of chart to display
             
         Returns:
             HTML string for the chart container
         """
-        icon_map = {
-            'languages': '<i class="fas fa-code text-blue-500 animate-icon-pulse" aria-hidden="true"></i>',
-            'complexity': '<i class="fas fa-layer-group text-orange-500 animate-icon-pulse" aria-hidden="true"></i>',
-            'security': '<i class="fas fa-shield-alt text-red-500 animate-icon-pulse" aria-hidden="true"></i>',
-            'code_smells': '<i class="fas fa-bug text-purple-500 animate-icon-pulse" aria-hidden="true"></i>'
-        }
+        icon = _CHART_ICONS.get(chart_id, _DEFAULT_CHART_ICON)
+        hover_effect = _CHART_HOVER_EFFECTS.get(chart_id, _DEFAULT_CHART_HOVER_EFFECT)
 
-        icon = icon_map.get(chart_id, '<i class="fas fa-chart-pie text-blue-500 animate-icon-pulse" aria-hidden="true"></i>')
-        
-        hover_effect_class = "card-3d-effect"
-        
-        # Add specific hover effects for different chart types
-        hover_effects = {
-            'languages': '''
-                <div class="absolute -top-1 -right-1 w-2 h-2 bg-blue-400 rounded-full opacity-0 group-hover:opacity-100 transition-all duration-500 group-hover:animate-ping" style="animation-delay: 0.1s;"></div>
-                <div class="absolute top-1 right-1 w-1.5 h-1.5 bg-green-400 rounded-full opacity-0 group-hover:opacity-100 transition-all duration-500 group-hover:animate-ping" style="animation-delay: 0.2s;"></div>
-                <div class="absolute -bottom-1 right-2 w-1 h-1 bg-yellow-400 rounded-full opacity-0 group-hover:opacity-100 transition-all duration-500 group-hover:animate-ping" style="animation-delay: 0.3s;"></div>
-            ''',
-            'complexity': '''
-                <div class="absolute bottom-0 left-0 h-1 bg-gradient-to-r from-green-500 via-yellow-500 to-red-500 transform origin-left scale-x-0 group-hover:scale-x-100 transition-transform duration-1000 ease-out"></div>
-            ''',
-            'security': '''
-                <div class="absolute inset-0 rounded-2xl border-2 border-red-500/0 group-hover:border-red-500/20 transition-all duration-500"></div>
-                <div class="absolute top-4 right-4 opacity-0 group-hover:opacity-30 transition-opacity duration-500">
-                    <div class="w-10 h-0.5 bg-red-500/50 group-hover:animate-pulse"></div>
-                    <div class="w-7 h-0.5 bg-red-500/30 mt-1 group-hover:animate-pulse" style="animation-delay: 0.2s;"></div>
-                    <div class="w-4 h-0.5 bg-red-500/20 mt-1 group-hover:animate-pulse" style="animation-delay: 0.4s;"></div>
-                </div>
-            ''',
-            'code_smells': '''
-                <div class="absolute inset-0 bg-purple-500/5 opacity-0 group-hover:opacity-100 transition-opacity duration-700 rounded-2xl group-hover:animate-pulse"></div>
-                <div class="absolute bottom-0 left-0 h-1 bg-gradient-to-r from-purple-600 via-purple-400 to-purple-600 transform origin-left scale-x-0 group-hover:scale-x-100 transition-transform duration-1200 ease-in-out"></div>
-            '''
-        }
-        
-        hover_effect = hover_effects.get(chart_id, '''
-            <div class="absolute bottom-0 left-0 h-1 bg-gradient-to-r from-blue-500 to-blue-300 transform origin-left scale-x-0 group-hover:scale-x-100 transition-transform duration-1000 ease-out"></div>
-        ''')
+        return _CHART_CONTAINER_TEMPLATE.substitute(
+            icon=icon,
+            title=title,
+            hover_effect=hover_effect,
+            chart_id=chart_id
+        )
 
-        return f'''
-        <div class="stat-card {hover_effect_class} bg-card p-6 rounded-2xl shadow-md border border-theme h-full transition-all duration-500 hover:shadow-xl relative overflow-hidden group hover:scale-105">
-            <h3 class="text-lg font-semibold mb-4 flex items-center gap-2 text-body transition-all duration-300 group-hover:translate-x-2">
-                {icon} 
-                <span class="transition-all duration-300 group-hover:text-blue-500">{title}</span>
-            </h3>
-            {hover_effect}
-            <div class="h-64 w-full relative z-10 card-inner">
-                <canvas id="chart-{chart_id}" data-chart-type="{chart_type}" data-chart-data="{chart_id}" class="transition-all duration-500 group-hover:scale-105"></canvas>
-            </div>
-        </div>'''
 
+# The charts grid depends only on the static chart table, so it is rendered once;
+# the chart data itself is shipped separately in the JSON data block
+_CHARTS_GRID_HTML = minify_html(PlotReportGenerator._render_charts_grid_html())
 
-class HeaderComponent(ReportComponent):
-    """Header component for HTML report"""
 
-    @staticmethod
-    def render(metrics: 'ProjectMetrics') -> str:
-        """Render the header HTML section"""
-        timestamp = format_timestamp()
-        return f'''
+# Header markup, split around the timestamp slots once at import time
+_HEADER_FRAGMENTS = _split_at_slots(minify_html('''
         <div class="bg-gradient-to-r from-blue-600 to-blue-800 text-white p-12 text-center mb-8 rounded-3xl shadow-2xl relative overflow-hidden">
             <div class="absolute inset-0 opacity-30">
                 <div class="absolute inset-0" style="background-image: url('data:image/svg+xml,%3Csvg xmlns%3D%22http%3A%2F%2Fwww.w3.org%2F2000%2Fsvg%22 viewBox%3D%220 0 100 100%22%3E%3Cdefs%3E%3Cpattern id%3D%22grid%22 width%3D%2210%22 height%3D%2210%22 patternUnits%3D%22userSpaceOnUse%22%3E%3Cpath d%3D%22M 10 0 L 0 0 0 10%22 fill%3D%22none%22 stroke%3D%22var(--header-pattern)%22 stroke-width%3D%220.5%22%2F%3E%3C%2Fpattern%3E%3C%2Fdefs%3E%3Crect width%3D%22100%22 height%3D%22100%22 fill%3D%22url(%23grid)%22%2F%3E%3C%2Fsvg%3E');"></div>
@@ -691,141 +940,200 @@ class HeaderComponent(ReportComponent):
                 <h1 class="text-4xl lg:text-5xl font-bold mb-3 drop-shadow-sm flex items-center justify-center gap-4 flex-col sm:flex-row">
                     <span class="bg-clip-text text-transparent bg-gradient-to-r from-white to-blue-200">CodeLyzer Analysis Report</span>
                 </h1>
-                <p class="text-lg opacity-90 font-light tracking-wide">Generated on {timestamp}</p>
+                <p class="text-lg opacity-90 font-light tracking-wide">Generated on $timestamp</p>
                 <div class="flex justify-center mt-6">
                     <div class="bg-white/10 backdrop-blur-sm px-4 py-2 rounded-full text-sm font-medium inline-flex items-center gap-2 border border-white/20 shadow-inner">
                         <i class="fas fa-code-branch mr-1"></i>
-                        <span>Analyzing code quality since {timestamp.split()[0]}</span>
+                        <span>Analyzing code quality since $since</span>
                     </div>
                 </div>
             </div>
-        </div>'''
+        </div>'''), "timestamp", "since")
 
 
-class MetricsGridComponent(ReportComponent):
-    """Metrics grid component for HTML report"""
+class HeaderComponent(ReportComponent):
+    """Header component for HTML report"""
 
     @staticmethod
-    def render(metrics: 'ProjectMetrics') -> str:
-        """Render the metrics grid HTML section"""
-        return f'''
-        <div class="grid grid-cols-1 sm:grid-cols-2 lg:grid-cols-3 gap-6 mb-10 fade-in">
-            <div class="stat-card card-3d-effect bg-card p-7 rounded-2xl shadow-md border border-theme transition-all duration-500 hover:shadow-xl relative overflow-hidden group focus-within:outline-2 focus-within:outline-blue-600 focus-within:outline-offset-2 hover:scale-105" tabindex="0">
-                <div class="absolute top-0 left-0 right-0 h-1 bg-gradient-to-r from-blue-600 to-blue-400 transform origin-left scale-x-0 group-hover:scale-x-100 transition-transform duration-1000 ease-out"></div>
-                <div class="card-inner flex items-center justify-between mb-5">
-                    <div class="w-13 h-13 rounded-xl bg-gradient-to-br from-blue-600 to-blue-800 flex items-center justify-center text-white text-xl shadow-md transition-all duration-700 group-hover:scale-110 group-hover:rotate-6 relative">
-                        <i class="fas fa-file-code animate-icon-pulse" aria-hidden="true"></i>
-                        <div class="absolute -top-1 -right-1 w-2 h-2 bg-blue-500 rounded-full opacity-0 group-hover:opacity-100 transition-all duration-500 group-hover:animate-ping" style="animation-delay: 0.1s;"></div>
-                        <div class="absolute -bottom-1 -left-1 w-1.5 h-1.5 bg-blue-400 rounded-full opacity-0 group-hover:opacity-100 transition-all duration-500 group-hover:animate-ping" style="animation-delay: 0.3s;"></div>
-                    </div>
-                </div>
-                <div class="transform transition-all duration-700 group-hover:translate-x-2">
-                    <div class="text-5xl font-bold text-body leading-none mb-2 transition-all duration-700 group-hover:scale-110 group-hover:text-blue-600">{metrics.total_files:,}</div>
-                    <div class="text-muted font-medium uppercase text-xs tracking-wider transition-colors duration-300 group-hover:text-blue-600">Files Analyzed</div>
-                </div>
-                <div class="absolute inset-0 bg-blue-500/5 opacity-0 group-hover:opacity-100 transition-opacity duration-700 rounded-lg"></div>
-            </div>
-
-            <div class="stat-card card-3d-effect bg-card p-7 rounded-2xl shadow-md border border-theme transition-all duration-500 hover:shadow-xl relative overflow-hidden group focus-within:outline-2 focus-within:outline-green-600 focus-within:outline-offset-2 hover:scale-105" tabindex="0">
-                <div class="absolute top-0 left-0 right-0 h-1 bg-gradient-to-r from-green-500 to-green-400 transform origin-left scale-x-0 group-hover:scale-x-100 transition-transform duration-1000 ease-out"></div>
-                <div class="card-inner flex items-center justify-between mb-5">
-                    <div class="w-13 h-13 rounded-xl bg-gradient-to-br from-green-500 to-green-600 flex items-center justify-center text-white text-xl shadow-md transition-all duration-700 group-hover:scale-110 group-hover:rotate-6 relative">
-                        <i class="fas fa-code animate-icon-pulse" aria-hidden="true"></i>
-                        <div class="absolute top-2 left-1 w-1 h-1 bg-green-500 rounded-full opacity-0 group-hover:opacity-100 group-hover:animate-ping transition-all duration-300" style="animation-delay: 0s;"></div>
-                        <div class="absolute top-4 left-2 w-1 h-1 bg-green-400 rounded-full opacity-0 group-hover:opacity-100 group-hover:animate-ping transition-all duration-300" style="animation-delay: 0.2s;"></div>
-                        <div class="absolute top-6 left-3 w-1 h-1 bg-green-300 rounded-full opacity-0 group-hover:opacity-100 group-hover:animate-ping transition-all duration-300" style="animation-delay: 0.4s;"></div>
-                    </div>
-                </div>
-                <div class="transform transition-all duration-700 group-hover:translate-x-2">
-                    <div class="text-5xl font-bold text-body leading-none mb-2 transition-all duration-700 group-hover:scale-110 group-hover:text-green-600">{metrics.total_loc:,}</div>
-                    <div class="text-muted font-medium uppercase text-xs tracking-wider transition-colors duration-300 group-hover:text-green-600">Lines of Code</div>
-                </div>
-                <div class="absolute inset-0 bg-green-500/5 opacity-0 group-hover:opacity-100 transition-opacity duration-700 rounded-lg"></div>
-            </div>
-
-            <div class="stat-card card-3d-effect bg-card p-7 rounded-2xl shadow-md border border-theme transition-all duration-500 hover:shadow-xl relative overflow-hidden group focus-within:outline-2 focus-within:outline-yellow-600 focus-within:outline-offset-2 hover:scale-105" tabindex="0">
-                <div class="absolute top-0 left-0 right-0 h-1 bg-gradient-to-r from-yellow-500 to-yellow-400 transform origin-left scale-x-0 group-hover:scale-x-100 transition-transform duration-1000 ease-out"></div>
+    def render(metrics: 'ProjectMetrics', timestamp: Optional[str] = None) -> str:
+        """Render the header HTML section, optionally with a precomputed timestamp"""
+        parts = []
+        HeaderComponent.render_into(metrics, parts, timestamp)
+        return "".join(parts)
+
+    @classmethod
+    def render_into(cls, metrics: 'ProjectMetrics', out: List[str], timestamp: Optional[str] = None) -> None:
+        """Append the header fragments, optionally with a precomputed timestamp"""
+        if timestamp is None:
+            timestamp = format_timestamp()
+        fragments = _HEADER_FRAGMENTS
+        out.extend((fragments[0], timestamp, fragments[1], timestamp.split()[0], fragments[2]))
+
+
+# Metric card markup, compiled once at import time; every card in the
+# metrics grid is rendered from this template and a row of _METRIC_CARDS
+_METRIC_CARD_TEMPLATE = Template('''
+            <div class="stat-card card-3d-effect bg-card p-7 rounded-2xl shadow-md border border-theme transition-all duration-500 hover:shadow-xl relative overflow-hidden group focus-within:outline-2 focus-within:outline-$accent focus-within:outline-offset-2 hover:scale-105" tabindex="0">
+                <div class="absolute top-0 left-0 right-0 h-1 bg-gradient-to-r $bar_gradient transform origin-left scale-x-0 group-hover:scale-x-100 transition-transform $bar_timing"></div>
                 <div class="card-inner flex items-center justify-between mb-5">
-                    <div class="w-13 h-13 rounded-xl bg-gradient-to-br from-yellow-500 to-yellow-600 flex items-center justify-center text-white text-xl shadow-md transition-all duration-700 group-hover:scale-110 group-hover:rotate-6 relative">
-                        <i class="fas fa-cube animate-icon-pulse" aria-hidden="true"></i>
-                        <div class="absolute -top-1 -left-1 w-1 h-1 bg-yellow-400 rounded-full opacity-0 group-hover:opacity-100 group-hover:animate-ping transition-all duration-300" style="animation-delay: 0s;"></div>
-                        <div class="absolute -top-2 -right-1 w-1.5 h-1.5 bg-yellow-300 rounded-full opacity-0 group-hover:opacity-100 group-hover:animate-ping transition-all duration-300" style="animation-delay: 0.3s;"></div>
-                        <div class="absolute -bottom-1 -left-2 w-1 h-1 bg-yellow-200 rounded-full opacity-0 group-hover:opacity-100 group-hover:animate-ping transition-all duration-300" style="animation-delay: 0.6s;"></div>
+                    <div class="w-13 h-13 rounded-xl bg-gradient-to-br $icon_gradient flex items-center justify-center text-white text-xl shadow-md transition-all duration-700 group-hover:scale-110 group-hover:rotate-6 relative">
+                        <i class="fas $icon animate-icon-pulse" aria-hidden="true"></i>$decorations
                     </div>
                 </div>
                 <div class="transform transition-all duration-700 group-hover:translate-x-2">
-                    <div class="text-5xl font-bold text-body leading-none mb-2 transition-all duration-700 group-hover:scale-110 group-hover:text-yellow-600">{metrics.total_classes:,}</div>
-                    <div class="text-muted font-medium uppercase text-xs tracking-wider transition-colors duration-300 group-hover:text-yellow-600">Classes</div>
+                    <div class="text-5xl font-bold text-body leading-none mb-2 transition-all duration-700 group-hover:scale-110 group-hover:text-$highlight$value_effect">$value</div>
+                    <div class="text-muted font-medium uppercase text-xs tracking-wider transition-colors duration-300 group-hover:text-$highlight">$label</div>
                 </div>
-                <div class="absolute inset-0 bg-yellow-500/5 opacity-0 group-hover:opacity-100 transition-opacity duration-700 rounded-lg"></div>
+                <div class="absolute inset-0 $overlay opacity-0 group-hover:opacity-100 transition-opacity duration-700 rounded-lg$overlay_effect"></div>
             </div>
-
-            <div class="stat-card card-3d-effect bg-card p-7 rounded-2xl shadow-md border border-theme transition-all duration-500 hover:shadow-xl relative overflow-hidden group focus-within:outline-2 focus-within:outline-red-600 focus-within:outline-offset-2 hover:scale-105" tabindex="0">
-                <div class="absolute top-0 left-0 right-0 h-1 bg-gradient-to-r from-red-500 to-red-400 transform origin-left scale-x-0 group-hover:scale-x-100 transition-transform duration-1000 ease-out"></div>
-                <div class="card-inner flex items-center justify-between mb-5">
-                    <div class="w-13 h-13 rounded-xl bg-gradient-to-br from-red-500 to-red-600 flex items-center justify-center text-white text-xl shadow-md transition-all duration-700 group-hover:scale-110 group-hover:rotate-6 relative">
-                        <i class="fas fa-cogs animate-icon-pulse" aria-hidden="true"></i>
+''')
+
+# (metric attribute, value format, card styling) for each card in display order
+_METRIC_CARDS = (
+    ("total_files", "{:,}", {
+        "label": "Files Analyzed",
+        "icon": "fa-file-code",
+        "accent": "blue-600",
+        "highlight": "blue-600",
+        "bar_gradient": "from-blue-600 to-blue-400",
+        "bar_timing": "duration-1000 ease-out",
+        "icon_gradient": "from-blue-600 to-blue-800",
+        "overlay": "bg-blue-500/5",
+        "value_effect": "",
+        "overlay_effect": "",
+        "decorations": '''
+                        <div class="absolute -top-1 -right-1 w-2 h-2 bg-blue-500 card-spark duration-500" style="animation-delay: 0.1s;"></div>
+                        <div class="absolute -bottom-1 -left-1 w-1.5 h-1.5 bg-blue-400 card-spark duration-500" style="animation-delay: 0.3s;"></div>''',
+    }),
+    ("total_loc", "{:,}", {
+        "label": "Lines of Code",
+        "icon": "fa-code",
+        "accent": "green-600",
+        "highlight": "green-600",
+        "bar_gradient": "from-green-500 to-green-400",
+        "bar_timing": "duration-1000 ease-out",
+        "icon_gradient": "from-green-500 to-green-600",
+        "overlay": "bg-green-500/5",
+        "value_effect": "",
+        "overlay_effect": "",
+        "decorations": '''
+                        <div class="absolute top-2 left-1 w-1 h-1 bg-green-500 card-spark duration-300" style="animation-delay: 0s;"></div>
+                        <div class="absolute top-4 left-2 w-1 h-1 bg-green-400 card-spark duration-300" style="animation-delay: 0.2s;"></div>
+                        <div class="absolute top-6 left-3 w-1 h-1 bg-green-300 card-spark duration-300" style="animation-delay: 0.4s;"></div>''',
+    }),
+    ("total_classes", "{:,}", {
+        "label": "Classes",
+        "icon": "fa-cube",
+        "accent": "yellow-600",
+        "highlight": "yellow-600",
+        "bar_gradient": "from-yellow-500 to-yellow-400",
+        "bar_timing": "duration-1000 ease-out",
+        "icon_gradient": "from-yellow-500 to-yellow-600",
+        "overlay": "bg-yellow-500/5",
+        "value_effect": "",
+        "overlay_effect": "",
+        "decorations": '''
+                        <div class="absolute -top-1 -left-1 w-1 h-1 bg-yellow-400 card-spark duration-300" style="animation-delay: 0s;"></div>
+                        <div class="absolute -top-2 -right-1 w-1.5 h-1.5 bg-yellow-300 card-spark duration-300" style="animation-delay: 0.3s;"></div>
+                        <div class="absolute -bottom-1 -left-2 w-1 h-1 bg-yellow-200 card-spark duration-300" style="animation-delay: 0.6s;"></div>''',
+    }),
+    ("total_functions", "{:,}", {
+        "label": "Functions",
+        "icon": "fa-cogs",
+        "accent": "red-600",
+        "highlight": "red-600",
+        "bar_gradient": "from-red-500 to-red-400",
+        "bar_timing": "duration-1000 ease-out",
+        "icon_gradient": "from-red-500 to-red-600",
+        "overlay": "bg-red-500/5",
+        "value_effect": "",
+        "overlay_effect": "",
+        "decorations": '''
                         <!-- Ripple effects for activity -->
-                        <div class="absolute inset-0 rounded-full bg-red-500/20 opacity-0 group-hover:opacity-100 group-hover:animate-ping transition-all duration-700"></div>
-                        <div class="absolute inset-1 rounded-full bg-red-500/15 opacity-0 group-hover:opacity-100 group-hover:animate-ping transition-all duration-700" style="animation-delay: 0.3s;"></div>
-                        <div class="absolute inset-2 rounded-full bg-red-500/10 opacity-0 group-hover:opacity-100 group-hover:animate-ping transition-all duration-700" style="animation-delay: 0.6s;"></div>
-                    </div>
-                </div>
-                <div class="transform transition-all duration-700 group-hover:translate-x-2">
-                    <div class="text-5xl font-bold text-body leading-none mb-2 transition-all duration-700 group-hover:scale-110 group-hover:text-red-600">{metrics.total_functions:,}</div>
-                    <div class="text-muted font-medium uppercase text-xs tracking-wider transition-colors duration-300 group-hover:text-red-600">Functions</div>
-                </div>
-                <div class="absolute inset-0 bg-red-500/5 opacity-0 group-hover:opacity-100 transition-opacity duration-700 rounded-lg"></div>
-            </div>
-
-            <div class="stat-card card-3d-effect bg-card p-7 rounded-2xl shadow-md border border-theme transition-all duration-500 hover:shadow-xl relative overflow-hidden group focus-within:outline-2 focus-within:outline-blue-600 focus-within:outline-offset-2 hover:scale-105" tabindex="0">
-                <div class="absolute top-0 left-0 right-0 h-1 bg-gradient-to-r from-blue-400 via-blue-300 to-blue-400 transform origin-left scale-x-0 group-hover:scale-x-100 transition-transform duration-1000 ease-out"></div>
-                <div class="card-inner flex items-center justify-between mb-5">
-                    <div class="w-13 h-13 rounded-xl bg-gradient-to-br from-blue-400 to-blue-500 flex items-center justify-center text-white text-xl shadow-md transition-all duration-700 group-hover:scale-110 group-hover:rotate-6 relative">
-                        <i class="fas fa-star animate-icon-pulse" aria-hidden="true"></i>
+                        <div class="absolute inset-0 bg-red-500/20 card-spark duration-700"></div>
+                        <div class="absolute inset-1 bg-red-500/15 card-spark duration-700" style="animation-delay: 0.3s;"></div>
+                        <div class="absolute inset-2 bg-red-500/10 card-spark duration-700" style="animation-delay: 0.6s;"></div>''',
+    }),
+    ("code_quality_score", "{:.1f}%", {
+        "label": "Code Quality",
+        "icon": "fa-star",
+        "accent": "blue-600",
+        "highlight": "blue-400",
+        "bar_gradient": "from-blue-400 via-blue-300 to-blue-400",
+        "bar_timing": "duration-1000 ease-out",
+        "icon_gradient": "from-blue-400 to-blue-500",
+        "overlay": "bg-blue-400/5",
+        "value_effect": " group-hover:drop-shadow-lg",
+        "overlay_effect": " group-hover:animate-pulse",
+        "decorations": '''
                         <!-- Sparkle effects around the star -->
-                        <div class="absolute -top-1 -right-1 w-2 h-2 bg-blue-400 rounded-full opacity-0 group-hover:opacity-100 transition-all duration-500 group-hover:animate-ping" style="animation-delay: 0.1s;"></div>
-                        <div class="absolute -top-2 right-1 w-1.5 h-1.5 bg-blue-300 rounded-full opacity-0 group-hover:opacity-100 transition-all duration-500 group-hover:animate-ping" style="animation-delay: 0.2s;"></div>
-                        <div class="absolute top-0 -right-2 w-1 h-1 bg-blue-200 rounded-full opacity-0 group-hover:opacity-100 transition-all duration-500 group-hover:animate-ping" style="animation-delay: 0.3s;"></div>
-                    </div>
-                </div>
-                <div class="transform transition-all duration-700 group-hover:translate-x-2">
-                    <div class="text-5xl font-bold text-body leading-none mb-2 transition-all duration-700 group-hover:scale-110 group-hover:text-blue-400 group-hover:drop-shadow-lg">{metrics.code_quality_score:.1f}%</div>
-                    <div class="text-muted font-medium uppercase text-xs tracking-wider transition-colors duration-300 group-hover:text-blue-400">Code Quality</div>
-                </div>
-                <div class="absolute inset-0 bg-blue-400/5 opacity-0 group-hover:opacity-100 transition-opacity duration-700 rounded-lg group-hover:animate-pulse"></div>
-            </div>
-
-            <div class="stat-card card-3d-effect bg-card p-7 rounded-2xl shadow-md border border-theme transition-all duration-500 hover:shadow-xl relative overflow-hidden group focus-within:outline-2 focus-within:outline-purple-600 focus-within:outline-offset-2 hover:scale-105" tabindex="0">
-                <div class="absolute top-0 left-0 right-0 h-1 bg-gradient-to-r from-purple-500 via-purple-400 to-purple-300 transform origin-left scale-x-0 group-hover:scale-x-100 transition-transform duration-1200 ease-in-out"></div>
-                <div class="card-inner flex items-center justify-between mb-5">
-                    <div class="w-13 h-13 rounded-xl bg-gradient-to-br from-purple-500 to-purple-600 flex items-center justify-center text-white text-xl shadow-md transition-all duration-700 group-hover:scale-110 group-hover:rotate-6 relative">
-                        <i class="fas fa-tools animate-icon-pulse" aria-hidden="true"></i>
+                        <div class="absolute -top-1 -right-1 w-2 h-2 bg-blue-400 card-spark duration-500" style="animation-delay: 0.1s;"></div>
+                        <div class="absolute -top-2 right-1 w-1.5 h-1.5 bg-blue-300 card-spark duration-500" style="animation-delay: 0.2s;"></div>
+                        <div class="absolute top-0 -right-2 w-1 h-1 bg-blue-200 card-spark duration-500" style="animation-delay: 0.3s;"></div>''',
+    }),
+    ("maintainability_score", "{:.1f}%", {
+        "label": "Maintainability",
+        "icon": "fa-tools",
+        "accent": "purple-600",
+        "highlight": "purple-500",
+        "bar_gradient": "from-purple-500 via-purple-400 to-purple-300",
+        "bar_timing": "duration-1200 ease-in-out",
+        "icon_gradient": "from-purple-500 to-purple-600",
+        "overlay": "bg-purple-500/5",
+        "value_effect": "",
+        "overlay_effect": "",
+        "decorations": '''
                         <!-- Floating mini boxes to represent tools -->
                         <div class="absolute top-4 right-4 opacity-0 group-hover:opacity-30 transition-opacity duration-500">
                             <div class="w-8 h-0.5 bg-purple-300 group-hover:animate-pulse"></div>
                             <div class="w-6 h-0.5 bg-purple-300/70 mt-1 group-hover:animate-pulse" style="animation-delay: 0.2s;"></div>
                             <div class="w-4 h-0.5 bg-purple-300/50 mt-1 group-hover:animate-pulse" style="animation-delay: 0.4s;"></div>
-                        </div>
-                    </div>
-                </div>
-                <div class="transform transition-all duration-700 group-hover:translate-x-2">
-                    <div class="text-5xl font-bold text-body leading-none mb-2 transition-all duration-700 group-hover:scale-110 group-hover:text-purple-500">{metrics.maintainability_score:.1f}%</div>
-                    <div class="text-muted font-medium uppercase text-xs tracking-wider transition-colors duration-300 group-hover:text-purple-500">Maintainability</div>
-                </div>
-                <div class="absolute inset-0 bg-purple-500/5 opacity-0 group-hover:opacity-100 transition-opacity duration-700 rounded-lg"></div>
-            </div>
-        </div>'''
+                        </div>''',
+    }),
+)
 
+_METRICS_GRID_OPEN = '<div class="grid grid-cols-1 sm:grid-cols-2 lg:grid-cols-3 gap-6 mb-10 fade-in">'
+_METRICS_GRID_CLOSE = '</div>'
+
+# The whole metrics grid compiled once at import time: every card's static
+# styling is substituted in and the markup is split at the $value slots, so
+# rendering only interleaves the formatted values with these fragments
+_METRICS_GRID_FRAGMENTS = tuple((
+    _METRICS_GRID_OPEN
+    + "".join(minify_html(_METRIC_CARD_TEMPLATE.safe_substitute(card)) for _, _, card in _METRIC_CARDS)
+    + _METRICS_GRID_CLOSE
+).split("$value"))
+
+# Fetches every card's metric in one call, paired with each card's value formatter
+_get_metric_values = attrgetter(*(attribute for attribute, _, _ in _METRIC_CARDS))
+_METRIC_VALUE_FORMATTERS = tuple(value_format.format for _, value_format, _ in _METRIC_CARDS)
 
-class FooterComponent(ReportComponent):
-    """Footer component for HTML report"""
+
+class MetricsGridComponent(ReportComponent):
+    """Metrics grid component for HTML report"""
 
     @staticmethod
     def render(metrics: 'ProjectMetrics') -> str:
-        """Render the footer HTML section"""
-        current_year = datetime.now().year
-        return f'''
+        """Render the metrics grid HTML section"""
+        parts = []
+        MetricsGridComponent.render_into(metrics, parts)
+        return "".join(parts)
+
+    @classmethod
+    def render_into(cls, metrics: 'ProjectMetrics', out: List[str]) -> None:
+        """Append the metrics grid fragments interleaved with the formatted values"""
+        fragments = _METRICS_GRID_FRAGMENTS
+        append = out.append
+        for fragment, format_value, value in zip(fragments, _METRIC_VALUE_FORMATTERS, _get_metric_values(metrics)):
+            append(fragment)
+            append(format_value(value))
+        append(fragments[-1])
+
+
+# Footer markup, split around the year once at import time. The copyright sign is
+# written as an entity so the static templates stay ASCII; project data such as
+# file paths and language names can still bring non-ASCII text into the report
+_FOOTER_FRAGMENTS = _split_at_slots(minify_html('''
         <div class="mt-16 border-t border-theme py-10 bg-gradient-to-r from-gray-50 dark:from-gray-900 to-transparent rounded-xl fade-in">
             <div class="text-center">
                 <div class="flex items-center justify-center mb-4">
@@ -836,23 +1144,41 @@ class FooterComponent(ReportComponent):
                     Delivering deep insights into your codebase quality, security, and maintainability
                 </p>
                 <div class="flex items-center justify-center gap-4 text-xs text-muted mt-4">
-                    <span>© {current_year} CodeLyzer</span>
+                    <span>&copy; $year CodeLyzer</span>
                     <span class="w-1 h-1 rounded-full bg-gray-300 dark:bg-gray-700"></span>
                     <span>Advanced Code Analysis</span>
                     <span class="w-1 h-1 rounded-full bg-gray-300 dark:bg-gray-700"></span>
                     <span>v1.0.0</span>
                 </div>
             </div>
-        </div>'''
+        </div>'''), "year")
 
 
-class ThemeToggleComponent(ReportComponent):
-    """Theme toggle button component for HTML report"""
-    
+class FooterComponent(ReportComponent):
+    """Footer component for HTML report"""
+
     @staticmethod
-    def render(metrics: 'ProjectMetrics') -> str:
-        """Render the theme toggle button HTML section"""
-        return '''
+    def render(metrics: 'ProjectMetrics', year: Optional[int] = None) -> str:
+        """Render the footer HTML section, optionally for a precomputed year"""
+        if year is None:
+            year = datetime.now().year
+        return FooterComponent._render_for_year(year)
+
+    @classmethod
+    def render_into(cls, metrics: 'ProjectMetrics', out: List[str], year: Optional[int] = None) -> None:
+        """Append the footer, optionally for a precomputed year"""
+        out.append(cls.render(metrics, year))
+
+    @staticmethod
+    @functools.lru_cache(maxsize=2)
+    def _render_for_year(year: int) -> str:
+        """Render the footer for a copyright year; the result only changes with the year"""
+        fragments = _FOOTER_FRAGMENTS
+        return "".join((fragments[0], str(year), fragments[1]))
+
+
+# Theme toggle button markup, identical for every report
+_THEME_TOGGLE_HTML = minify_html('''
         <div class="fixed top-4 right-4 z-50">
             <button id="theme-toggle" class="p-3 rounded-full bg-white/80 dark:bg-gray-800/80 shadow-md hover:shadow-xl transition-all duration-300 backdrop-blur-md border border-gray-200 dark:border-gray-700 text-gray-800 dark:text-gray-200 group relative overflow-hidden">
                 <!-- Animated background pulse -->
@@ -888,547 +1214,470 @@ class ThemeToggleComponent(ReportComponent):
                 <!-- Glowing border that appears on hover -->
                 <div class="absolute inset-0 rounded-full border border-transparent group-hover:border-blue-500/30 dark:group-hover:border-yellow-500/30 transition-all duration-300"></div>
             </button>
-        </div>'''
+        </div>''')
 
 
-def format_timestamp() -> str:
-    """Format the current timestamp for display.
+class ThemeToggleComponent(ReportComponent):
+    """Theme toggle button component for HTML report"""
+    
+    @staticmethod
+    def render(metrics: 'ProjectMetrics') -> str:
+        """Render the theme toggle button HTML section"""
+        return _THEME_TOGGLE_HTML
 
-    Returns:
-        Formatted timestamp string
-    """
-    return datetime.now().strftime("%B %d, %Y at %H:%M:%S")
 
+# Human-readable display format for report timestamps
+_TIMESTAMP_FORMAT = "%B %d, %Y at %H:%M:%S"
 
-class HTMLReportGenerator:
-    """Generate HTML reports for codebase analysis metrics."""
 
-    def __init__(self) -> None:
-        """Initialize the HTML report generator."""
-        self._plot_generator = PlotReportGenerator()
-        self._default_theme = "light"
+def format_timestamp(now: Optional[datetime] = None) -> str:
+    """Format a timestamp for display.
 
-    def create(self, metrics: 'ProjectMetrics', output_dir: str = "reports") -> str:
-        """Generate HTML report for the given metrics.
-        
-        Args:
-            metrics: ProjectMetrics object containing analysis data
-            output_dir: Directory to save the report and assets (default: reports)
-            
-        Returns:
-            Complete HTML report as a string
-        """
-        self._prepare_data(metrics)
-        
-        # Copy favicon to output directory
-        favicon_path = copy_favicon_to_output(output_dir)
-        
-        return self._build_html_template(metrics, favicon_path)
+    Args:
+        now: Moment to format; defaults to the current time. Pass a shared
+            value when generating several reports in one batch.
 
-    def _prepare_data(self, metrics: 'ProjectMetrics') -> None:
-        """Prepare all data components for the HTML template.
-        
-        Args:
-            metrics: ProjectMetrics object containing analysis data
-        """
-        self._plot_generator.prepare_chart_data(metrics)
+    Returns:
+        Formatted timestamp string
+    """
+    if now is None:
+        now = datetime.now()
+    return now.strftime(_TIMESTAMP_FORMAT)
 
-    def _build_html_template(self, metrics: 'ProjectMetrics', favicon_path: str = "") -> str:
-        """Build the complete HTML template for the report.
-        
-        Args:
-            metrics: ProjectMetrics object containing analysis data
-            favicon_path: Path to the favicon file
-            
-        Returns:
-            Complete HTML report as a string
-        """
-        return f'''
-<!DOCTYPE html>
-<html lang="en" class="{self._default_theme}">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>CodeLyzer - Advanced Code Analysis Report</title>
-    <link rel="icon" href="{favicon_path}" type="image/png">
+
+# Static parts of the report <head>, built once at import time
+_REPORT_HEAD_LINKS = '''
     <link rel="preconnect" href="https://fonts.googleapis.com">
     <link rel="preconnect" href="https://fonts.gstatic.com" crossorigin>
-    <link href="https://fonts.googleapis.com/css2?family=Inter:wght@300;400;500;600;700&family=JetBrains+Mono:wght@400;500;600&display=swap" rel="stylesheet">
-    <link rel="stylesheet" href="https://cdnjs.cloudflare.com/ajax/libs/font-awesome/6.0.0/css/all.min.css">
-    <script src="https://cdn.jsdelivr.net/npm/chart.js@4.3.0/dist/chart.umd.min.js"></script>
-    <script src="https://cdn.tailwindcss.com"></script>
-    <style>
-        :root {{
-            color-scheme: light dark;
-            
-            /* Light theme variables */
-            --bg-primary: {ThemeColors.LIGHT["bg_primary"]};
-            --bg-secondary: {ThemeColors.LIGHT["bg_secondary"]};
-            --text-primary: {ThemeColors.LIGHT["text_primary"]};
-            --text-secondary: {ThemeColors.LIGHT["text_secondary"]};
-            --border-color: {ThemeColors.LIGHT["border"]};
-            --border-secondary: {ThemeColors.LIGHT["border_secondary"]};
-            
-            --brand-primary: {ThemeColors.LIGHT["brand_primary"]};
-            --brand-primary-dark: {ThemeColors.LIGHT["brand_primary_dark"]};
-            --brand-secondary: {ThemeColors.LIGHT["brand_secondary"]};
-            --brand-gradient-from: {ThemeColors.LIGHT["brand_gradient_from"]};
-            --brand-gradient-to: {ThemeColors.LIGHT["brand_gradient_to"]};
-            
-            --card-shadow: {ThemeColors.LIGHT["card_shadow"]};
-            --header-pattern: {ThemeColors.LIGHT["header_pattern"]};
-            --header-gradient-overlay: {ThemeColors.LIGHT["header_gradient_overlay"]};
-            
-            /* Selection colors */
-            --selection-bg: {ThemeColors.LIGHT["selection_bg"]};
-            --selection-text: {ThemeColors.LIGHT["selection_text"]};
-        }}
-        
-        .dark {{
-            /* Dark theme variables */
-            --bg-primary: {ThemeColors.DARK["bg_primary"]};
-            --bg-secondary: {ThemeColors.DARK["bg_secondary"]};
-            --text-primary: {ThemeColors.DARK["text_primary"]};
-            --text-secondary: {ThemeColors.DARK["text_secondary"]};
-            --border-color: {ThemeColors.DARK["border"]};
-            --border-secondary: {ThemeColors.DARK["border_secondary"]};
+    <link rel="preconnect" href="https://cdnjs.cloudflare.com" crossorigin>
+    <link rel="preconnect" href="https://cdn.jsdelivr.net" crossorigin>
+    <!-- Preload stylesheets so they don't block first paint -->
+    <link rel="preload" href="https://fonts.googleapis.com/css2?family=Inter:wght@300;400;500;600;700&family=JetBrains+Mono:wght@400;500;600&display=swap" as="style" onload="this.onload=null;this.rel='stylesheet'">
+    <link rel="preload" href="https://cdnjs.cloudflare.com/ajax/libs/font-awesome/6.0.0/css/all.min.css" as="style" onload="this.onload=null;this.rel='stylesheet'">
+    <noscript>
+        <link href="https://fonts.googleapis.com/css2?family=Inter:wght@300;400;500;600;700&family=JetBrains+Mono:wght@400;500;600&display=swap" rel="stylesheet">
+        <link rel="stylesheet" href="https://cdnjs.cloudflare.com/ajax/libs/font-awesome/6.0.0/css/all.min.css">
+    </noscript>
+    <script src="https://cdn.jsdelivr.net/npm/chart.js@4.3.0/dist/chart.umd.min.js" defer></script>
+    <script src="https://cdn.tailwindcss.com"></script>'''
+
+# Theme colour variables for one theme, filled in from a ThemeColors palette
+_THEME_VARIABLES_TEMPLATE = Template('''
+            --bg-primary: $bg_primary;
+            --bg-secondary: $bg_secondary;
+            --text-primary: $text_primary;
+            --text-secondary: $text_secondary;
+            --border-color: $border;
+            --border-secondary: $border_secondary;
             
-            --brand-primary: {ThemeColors.DARK["brand_primary"]};
-            --brand-primary-dark: {ThemeColors.DARK["brand_primary_dark"]};
-            --brand-secondary: {ThemeColors.DARK["brand_secondary"]};
-            --brand-gradient-from: {ThemeColors.DARK["brand_gradient_from"]};
-            --brand-gradient-to: {ThemeColors.DARK["brand_gradient_to"]};
+            --brand-primary: $brand_primary;
+            --brand-primary-dark: $brand_primary_dark;
+            --brand-secondary: $brand_secondary;
+            --brand-gradient-from: $brand_gradient_from;
+            --brand-gradient-to: $brand_gradient_to;
             
-            --card-shadow: {ThemeColors.DARK["card_shadow"]};
-            --header-pattern: {ThemeColors.DARK["header_pattern"]};
-            --header-gradient-overlay: {ThemeColors.DARK["header_gradient_overlay"]};
+            --card-shadow: $card_shadow;
+            --header-pattern: $header_pattern;
+            --header-gradient-overlay: $header_gradient_overlay;
             
             /* Selection colors */
-            --selection-bg: {ThemeColors.DARK["selection_bg"]};
-            --selection-text: {ThemeColors.DARK["selection_text"]};
-        }}
-        
-        * {{
+            --selection-bg: $selection_bg;
+            --selection-text: $selection_text;
+''')
+
+# Light and dark theme variables, filled in from the ThemeColors palettes
+_THEME_VARIABLES_CSS = (
+    ":root { color-scheme: light dark;" + _THEME_VARIABLES_TEMPLATE.substitute(ThemeColors.LIGHT) + "}"
+    + ".dark {" + _THEME_VARIABLES_TEMPLATE.substitute(ThemeColors.DARK) + "}"
+)
+
+# Report stylesheet, minified into the inline <style> block
+_REPORT_CSS = '''
+        * {
             margin: 0;
             padding: 0;
             box-sizing: border-box;
-        }}
+        }
         
-        body {{
+        body {
             font-family: 'Inter', sans-serif;
             line-height: 1.5;
             color: var(--text-primary);
             background-color: var(--bg-primary);
             transition: background-color 0.3s ease, color 0.3s ease;
-        }}
+        }
         
         /* Selection styling */
-        ::selection {{
+        ::selection {
             background-color: var(--selection-bg);
             color: var(--selection-text);
-        }}
+        }
         
         /* Monospace font for code elements */
-        .font-mono, code, pre {{
+        .font-mono, code, pre {
             font-family: 'JetBrains Mono', monospace;
-        }}
+        }
         
         /* Custom scrollbar styling */
-        ::-webkit-scrollbar {{
+        ::-webkit-scrollbar {
             width: 12px;
             height: 12px;
-        }}
+        }
         
-        ::-webkit-scrollbar-track {{
+        ::-webkit-scrollbar-track {
             background-color: var(--bg-primary);
-        }}
+        }
         
-        ::-webkit-scrollbar-thumb {{
+        ::-webkit-scrollbar-thumb {
             background-color: var(--brand-primary);
             border-radius: 6px;
             border: 3px solid var(--bg-primary);
-        }}
+        }
         
-        ::-webkit-scrollbar-thumb:hover {{
+        ::-webkit-scrollbar-thumb:hover {
             background-color: var(--brand-primary-dark);
-        }}
+        }
         
-        @keyframes fadein {{
-            from {{ opacity: 0; transform: translateY(10px); }}
-            to {{ opacity: 1; transform: translateY(0); }}
-        }}
+        @keyframes fadein {
+            from { opacity: 0; transform: translateY(10px); }
+            to { opacity: 1; transform: translateY(0); }
+        }
         
-        .fade-in {{
+        .fade-in {
             animation: fadein 0.6s ease-out forwards;
-        }}
+        }
         
-        .bg-gradient-radial {{
+        .bg-gradient-radial {
             background: radial-gradient(circle, var(--header-gradient-overlay) 0%, transparent 100%);
-        }}
+        }
         
-        .w-13 {{
+        .w-13 {
             width: 3.25rem;
-        }}
+        }
         
-        .h-13 {{
+        .h-13 {
             height: 3.25rem;
-        }}
+        }
         
         /* Theme-aware Tailwind utilities */
-        .bg-card {{
+        .bg-card {
             background-color: var(--bg-secondary);
             border-color: var(--border-color);
             box-shadow: 0 4px 6px var(--card-shadow);
-        }}
+        }
         
-        .text-body {{
+        .text-body {
             color: var(--text-primary);
-        }}
+        }
         
-        .text-muted {{
+        .text-muted {
             color: var(--text-secondary);
-        }}
+        }
         
-        .border-theme {{
+        .border-theme {
             border-color: var(--border-color);
-        }}
+        }
         
         /* Advanced card animations */
-        .card-3d-effect {{
+        .card-3d-effect {
             transform-style: preserve-3d;
             perspective: 1000px;
             transition: all 0.3s ease;
-        }}
+        }
         
-        .card-3d-effect:hover {{
+        .card-3d-effect:hover {
             transform: scale(1.05) translateY(-5px) rotateX(2deg) rotateY(2deg);
             box-shadow: 0 15px 30px rgba(0, 0, 0, 0.15), 0 10px 15px rgba(0, 0, 0, 0.08);
-        }}
+        }
         
-        .card-inner {{
+        .card-inner {
             transform: translateZ(10px);
             transition: all 0.3s ease;
-        }}
+        }
         
-        @keyframes iconPulse {{
-            0% {{ transform: scale(1); }}
-            50% {{ transform: scale(1.1); }}
-            100% {{ transform: scale(1); }}
-        }}
+        /* Sparkle and ripple decorations that light up when a metric card is hovered */
+        .card-spark {
+            border-radius: 9999px;
+            opacity: 0;
+            transition-property: all;
+            transition-timing-function: cubic-bezier(0.4, 0, 0.2, 1);
+        }
+        
+        .group:hover .card-spark {
+            opacity: 1;
+            animation: ping 1s cubic-bezier(0, 0, 0.2, 1) infinite;
+        }
+        
+        @keyframes iconPulse {
+            0% { transform: scale(1); }
+            50% { transform: scale(1.1); }
+            100% { transform: scale(1); }
+        }
         
-        .animate-icon-pulse {{
+        .animate-icon-pulse {
             animation: iconPulse 2s ease-in-out infinite;
-        }}
+        }
         
-        @keyframes ping {{
-            0% {{ transform: scale(1); opacity: 1; }}
-            75%, 100% {{ transform: scale(2); opacity: 0; }}
-        }}
+        @keyframes ping {
+            0% { transform: scale(1); opacity: 1; }
+            75%, 100% { transform: scale(2); opacity: 0; }
+        }
         
-        .animate-ping {{
+        .animate-ping {
             animation: ping 1.5s cubic-bezier(0, 0, 0.2, 1) infinite;
-        }}
+        }
         
-        @keyframes pulse {{
-            0%, 100% {{ opacity: 1; }}
-            50% {{ opacity: 0.5; }}
-        }}
+        @keyframes pulse {
+            0%, 100% { opacity: 1; }
+            50% { opacity: 0.5; }
+        }
         
-        .animate-pulse {{
+        .animate-pulse {
             animation: pulse 2s cubic-bezier(0.4, 0, 0.6, 1) infinite;
-        }}
+        }
         
-        @keyframes float {{
-            0%, 100% {{ transform: translateY(0); opacity: 0.05; }}
-            50% {{ transform: translateY(-15px); opacity: 0.1; }}
-        }}
+        @keyframes float {
+            0%, 100% { transform: translateY(0); opacity: 0.05; }
+            50% { transform: translateY(-15px); opacity: 0.1; }
+        }
         
-        .animate-float {{
+        .animate-float {
             animation: float 10s ease-in-out infinite;
-        }}
+        }
         
-        @keyframes pulse-subtle {{
-            0% {{ opacity: 0.9; transform: scale(1); }}
-            50% {{ opacity: 1; transform: scale(1.05); }}
-            100% {{ opacity: 0.9; transform: scale(1); }}
-        }}
+        @keyframes pulse-subtle {
+            0% { opacity: 0.9; transform: scale(1); }
+            50% { opacity: 1; transform: scale(1.05); }
+            100% { opacity: 0.9; transform: scale(1); }
+        }
         
-        .animate-pulse-subtle {{
+        .animate-pulse-subtle {
             animation: pulse-subtle 3s ease-in-out infinite;
-        }}
-    </style>
-    <script>
-        tailwind.config = {{
-            darkMode: 'class',
-            theme: {{
-                extend: {{
-                    colors: {{
-                        brand: {{
-                            primary: 'var(--brand-primary)',
-                            secondary: 'var(--brand-secondary)',
-                        }}
-                    }}
-                }}
-            }}
-        }}
-    </script>
-</head>
-<body class="font-inter text-sm min-h-screen">
-    {ThemeToggleComponent.render(metrics)}
-    <div class="max-w-7xl mx-auto p-6">
-        {HeaderComponent.render(metrics)}
-        {MetricsGridComponent.render(metrics)}
-        {self._plot_generator.get_charts_grid_html()}
-        
-        <div class="grid grid-cols-1 lg:grid-cols-2 gap-6 mb-10 fade-in">
-            {ComplexFilesTableComponent.render(metrics)}
-            {DependenciesTableComponent.render(metrics)}
-        </div>
-        
-        {FooterComponent.render(metrics)}
-    </div>
-    {self._get_javascript()}
-    {self._get_theme_javascript()}
-</body>
-</html>'''
+        }
+'''
+# Tailwind CDN configuration, inlined so the report stays a single self-contained file
+_TAILWIND_CONFIG_JS = '''tailwind.config = {
+    darkMode: 'class',
+    theme: {
+        extend: {
+            colors: {
+                brand: {
+                    primary: 'var(--brand-primary)',
+                    secondary: 'var(--brand-secondary)',
+                }
+            }
+        }
+    }
+}
+'''
 
-    def _get_javascript(self) -> str:
-        """Get the JavaScript section for charts and animations.
-        
-        Returns:
-            JavaScript code for the report
-        """
-        chart_data_json = json.dumps(self._plot_generator.charts_data)
+# Inline stylesheet and Tailwind config; keeping them in the document means a
+# report opened or served on its own, away from output_dir, keeps its styling
+_REPORT_STYLE = (
+    f'<style>{_minify_css(_THEME_VARIABLES_CSS + _REPORT_CSS)}</style>'
+    f'<script>{_minify_js(_TAILWIND_CONFIG_JS)}</script>'
+)
 
-        return f'''
+
+# Chart setup and table sorting script shared by every report
+# Canvases to initialize, resolved here so the page never has to scan the DOM for them
+_CHART_REGISTRY_JSON = json.dumps(
+    [{"id": f"chart-{chart_id}", "key": chart_id, "type": chart_type} for chart_id, _, chart_type in _CHARTS],
+    separators=(",", ":")
+)
+
+# Fallback palette for charts whose data carries no colors of its own
+_DEFAULT_COLORS_JSON = json.dumps(ThemeColors.LIGHT["chart_colors"], separators=(",", ":"))
+
+_CHART_JAVASCRIPT = _minify_js(f'''
 <script>
-    // Chart data from Python
-    const chartData = {chart_data_json};
+    // Chart data from Python, parsed from the JSON data block
+    const chartData = JSON.parse(document.getElementById('chart-data').textContent);
     
-    // Common chart options and setup
-    const chartOptions = {{
-        languages: {{
-            type: 'doughnut',
-            options: {{
-                responsive: true,
-                maintainAspectRatio: false,
-                plugins: {{
-                    legend: {{
-                        position: 'bottom',
-                        labels: {{
-                            font: {{
-                                family: "'Inter', sans-serif",
-                                size: 11
-                            }},
-                            color: 'var(--text-primary)'
-                        }}
-                    }},
-                    tooltip: {{
-                        callbacks: {{
-                            label: function(context) {{
-                                const label = context.label || '';
-                                const value = context.raw || 0;
-                                const total = context.chart.data.datasets[0].data.reduce((a, b) => a + b, 0);
-                                const percentage = Math.round((value / total) * 100);
-                                return `${{label}}: ${{value}} files (${{percentage}}%)`;
-                            }}
-                        }}
-                    }}
-                }}
+    // Text and grid colors shared by every chart. They name the report's CSS
+    // variables, which the canvas cannot resolve, so Chart.js falls back to its defaults
+    const CHART_COLORS = Object.freeze({{
+        text: 'var(--text-primary)',
+        ticks: 'var(--text-secondary)',
+        grid: 'var(--border-color)'
+    }});
+    
+    // Options for one bar chart axis with the given title
+    function axisOpts(titleText) {{
+        return {{
+            title: {{
+                display: true,
+                text: titleText,
+                color: CHART_COLORS.text
+            }},
+            ticks: {{
+                color: CHART_COLORS.ticks
+            }},
+            grid: {{
+                color: CHART_COLORS.grid
             }}
-        }},
-        complexity: {{
-            type: 'bar',
-            options: {{
-                responsive: true,
-                maintainAspectRatio: false,
-                scales: {{
-                    y: {{
-                        beginAtZero: true,
-                        title: {{
-                            display: true,
-                            text: 'Number of Files',
-                            font: {{
-                                family: "'Inter', sans-serif",
-                                size: 12
-                            }},
-                            color: 'var(--text-primary)'
-                        }},
-                        ticks: {{
-                            color: 'var(--text-secondary)'
-                        }},
-                        grid: {{
-                            color: 'var(--border-color)'
-                        }}
-                    }},
-                    x: {{
-                        title: {{
-                            display: true,
-                            text: 'Complexity Level',
-                            font: {{
-                                family: "'Inter', sans-serif",
-                                size: 12
-                            }},
-                            color: 'var(--text-primary)'
-                        }},
-                        ticks: {{
-                            color: 'var(--text-secondary)'
-                        }},
-                        grid: {{
-                            color: 'var(--border-color)'
-                        }}
-                    }}
-                }},
-                plugins: {{
-                    legend: {{
-                        display: false
-                    }}
+        }};
+    }}
+    
+    // Options for a bar chart with the given axis titles; each call returns a
+    // fresh object since theme switching updates the colors per chart
+    function barOpts(yTitle, xTitle) {{
+        return {{
+            responsive: true,
+            maintainAspectRatio: false,
+            scales: {{
+                y: {{ beginAtZero: true, ...axisOpts(yTitle) }},
+                x: axisOpts(xTitle)
+            }},
+            plugins: {{
+                legend: {{
+                    display: false
                 }}
             }}
-        }},
-        security: {{
-            type: 'bar',
-            options: {{
-                responsive: true,
-                maintainAspectRatio: false,
-                scales: {{
-                    y: {{
-                        beginAtZero: true,
-                        title: {{
-                            display: true,
-                            text: 'Number of Issues',
-                            font: {{
-                                family: "'Inter', sans-serif",
-                                size: 12
-                            }},
-                            color: 'var(--text-primary)'
-                        }},
-                        ticks: {{
-                            color: 'var(--text-secondary)'
-                        }},
-                        grid: {{
-                            color: 'var(--border-color)'
-                        }}
-                    }},
-                    x: {{
-                        title: {{
-                            display: true,
-                            text: 'Severity Level',
-                            font: {{
-                                family: "'Inter', sans-serif",
-                                size: 12
-                            }},
-                            color: 'var(--text-primary)'
-                        }},
-                        ticks: {{
-                            color: 'var(--text-secondary)'
+        }};
+    }}
+    
+    // Chart.js options for each chart, keyed by chart id
+    const chartOptions = {{
+        languages: {{
+            responsive: true,
+            maintainAspectRatio: false,
+            plugins: {{
+                legend: {{
+                    position: 'bottom',
+                    labels: {{
+                        font: {{
+                            size: 11
                         }},
-                        grid: {{
-                            color: 'var(--border-color)'
-                        }}
+                        color: CHART_COLORS.text
                     }}
                 }},
-                plugins: {{
-                    legend: {{
-                        display: false
+                tooltip: {{
+                    callbacks: {{
+                        label: function(context) {{
+                            const label = context.label || '';
+                            const value = context.raw || 0;
+                            const total = context.chart.data.datasets[0].data.reduce((a, b) => a + b, 0);
+                            const percentage = Math.round((value / total) * 100);
+                            return `${{label}}: ${{value}} files (${{percentage}}%)`;
+                        }}
                     }}
                 }}
             }}
         }},
-        code_smells: {{
-            type: 'bar',
-            options: {{
-                responsive: true,
-                maintainAspectRatio: false,
-                scales: {{
-                    y: {{
-                        beginAtZero: true,
-                        title: {{
-                            display: true,
-                            text: 'Number of Issues',
-                            font: {{
-                                family: "'Inter', sans-serif",
-                                size: 12
-                            }},
-                            color: 'var(--text-primary)'
-                        }},
-                        ticks: {{
-                            color: 'var(--text-secondary)'
-                        }},
-                        grid: {{
-                            color: 'var(--border-color)'
-                        }}
-                    }},
-                    x: {{
-                        title: {{
-                            display: true,
-                            text: 'Severity Level',
-                            font: {{
-                                family: "'Inter', sans-serif",
-                                size: 12
-                            }},
-                            color: 'var(--text-primary)'
-                        }},
-                        ticks: {{
-                            color: 'var(--text-secondary)'
-                        }},
-                        grid: {{
-                            color: 'var(--border-color)'
-                        }}
-                    }}
-                }},
-                plugins: {{
-                    legend: {{
-                        display: false
+        complexity: barOpts('Number of Files', 'Complexity Level'),
+        security: barOpts('Number of Issues', 'Severity Level'),
+        code_smells: barOpts('Number of Issues', 'Severity Level')
+    }};
+    
+    // Default colors for charts without a palette of their own, shared by reference
+    const defaultColors = Object.freeze({_DEFAULT_COLORS_JSON});
+    
+    // Chart canvases emitted by the report generator
+    const chartList = {_CHART_REGISTRY_JSON};
+    
+    // Charts built per animation frame when they can't be deferred until visible
+    const CHARTS_PER_FRAME = 2;
+    
+    // Start building a chart this far before it scrolls into view
+    const CHART_VIEWPORT_MARGIN = '200px';
+    
+    // Create the chart for one registry entry
+    function buildChart(canvas, {{ key: dataKey, type: chartType }}) {{
+        const data = chartData[dataKey];
+        
+        if (!canvas || !data || !data.labels || !data.values) return;
+        
+        const bgColors = data.colors || defaultColors;
+        
+        // Create chart
+        const chart = new Chart(canvas, {{
+            type: chartType,
+            data: {{
+                labels: data.labels,
+                datasets: [
+                    {{
+                        data: data.values,
+                        backgroundColor: bgColors,
+                        borderColor: 'rgba(255, 255, 255, 0.8)',
+                        borderWidth: 1,
+                        hoverOffset: 4
                     }}
-                }}
-            }}
+                ]
+            }},
+            options: chartOptions[dataKey] || {{}}
+        }});
+        
+        // Store chart instance for later theme updates
+        window.chartInstances[dataKey] = chart;
+    }}
+    
+    // Canvas for a registry entry; charts with nothing to plot have their card
+    // removed instead of building an empty chart
+    function chartCanvas({{ id, key }}) {{
+        const canvas = document.getElementById(id);
+        if (!canvas) return null;
+        
+        const data = chartData[key];
+        if (data && data.labels && data.values && data.values.some(v => v !== 0)) return canvas;
+        
+        const card = canvas.closest('.stat-card');
+        if (card) card.remove();
+        return null;
+    }}
+    
+    // Build the next batch of charts and schedule the rest for the following frame
+    function drainCharts(start) {{
+        const end = Math.min(start + CHARTS_PER_FRAME, chartList.length);
+        for (let i = start; i < end; i++) {{
+            const canvas = chartCanvas(chartList[i]);
+            if (canvas) buildChart(canvas, chartList[i]);
         }}
-    }};
+        if (end < chartList.length) {{
+            requestAnimationFrame(() => drainCharts(end));
+        }}
+    }}
     
-    // Default colors for charts
-    const defaultColors = {json.dumps(ThemeColors.LIGHT["chart_colors"])};
+    // Build each chart only once its canvas comes near the viewport
+    function observeCharts() {{
+        const pending = new Map();
+        const observer = new IntersectionObserver((entries, obs) => {{
+            for (const entry of entries) {{
+                if (!entry.isIntersecting) continue;
+                obs.unobserve(entry.target);
+                buildChart(entry.target, pending.get(entry.target));
+                pending.delete(entry.target);
+            }}
+        }}, {{ rootMargin: CHART_VIEWPORT_MARGIN }});
+        
+        for (const chart of chartList) {{
+            const canvas = chartCanvas(chart);
+            if (!canvas) continue;
+            pending.set(canvas, chart);
+            observer.observe(canvas);
+        }}
+    }}
     
     // Set up charts after DOM is loaded
     document.addEventListener('DOMContentLoaded', function() {{
-        // Find all canvas elements with data-chart-data attribute
-        const chartElements = document.querySelectorAll('[data-chart-data]');
-        
-        // Initialize each chart
-        chartElements.forEach(canvas => {{
-            const dataKey = canvas.getAttribute('data-chart-data');
-            const data = chartData[dataKey];
-            
-            if (!data || !data.labels || !data.values) return;
-            
-            const chartType = canvas.getAttribute('data-chart-type') || chartOptions[dataKey]?.type || 'bar';
-            const bgColors = data.colors || defaultColors;
-            
-            // Create chart
-            const chart = new Chart(canvas, {{
-                type: chartType,
-                data: {{
-                    labels: data.labels,
-                    datasets: [
-                        {{
-                            data: data.values,
-                            backgroundColor: bgColors,
-                            borderColor: 'rgba(255, 255, 255, 0.8)',
-                            borderWidth: 1,
-                            hoverOffset: 4
-                        }}
-                    ]
-                }},
-                options: chartOptions[dataKey]?.options || {{}}
-            }});
-            
-            // Store chart instance for later theme updates
-            window.chartInstances = window.chartInstances || {{}};
-            window.chartInstances[dataKey] = chart;
-        }});
-
         // Set up table sorting functionality
         setupTableSorting();
+        
+        window.chartInstances = window.chartInstances || {{}};
+        if (typeof Chart === 'undefined') return;
+        
+        // Report font for every chart, set once instead of per axis and legend
+        Chart.defaults.font.family = "'Inter', sans-serif";
+        Chart.defaults.font.size = 12;
+
+        // A static report gains nothing from the entry animations, so charts draw in one pass
+        Chart.defaults.animation = false;
+
+        if ('IntersectionObserver' in window) {{
+            observeCharts();
+        }} else {{
+            requestAnimationFrame(() => drainCharts(0));
+        }}
     }});
     
     // Table sorting functionality
@@ -1436,74 +1685,83 @@ class HTMLReportGenerator:
         const table = document.getElementById('complex-files-table');
         if (!table) return;
         
+        const thead = table.querySelector('thead');
         const headers = table.querySelectorAll('th.sortable');
         const tbody = table.querySelector('tbody');
-        
+
         // Sort by complexity by default (descending)
         sortTableByColumn(tbody, 'complexity', true);
-        
-        headers.forEach(header => {{
-            header.addEventListener('click', () => {{
-                const sortKey = header.getAttribute('data-sort');
-                
-                // Toggle sort direction if clicking the same header again
-                let isDescending = true;
-                if (header.querySelector('.fa-sort-down')) {{
-                    isDescending = false;
-                }}
-                
-                // Reset all header icons
-                headers.forEach(h => {{
-                    const icon = h.querySelector('i');
-                    if (icon) {{
-                        icon.className = 'fas fa-sort ml-1 text-gray-400';
-                    }}
-                }});
-                
-                // Update clicked header icon
-                const icon = header.querySelector('i');
+
+        // One delegated listener for every sortable header
+        thead.addEventListener('click', event => {{
+            const header = event.target.closest('th.sortable');
+            if (!header) return;
+
+            const sortKey = header.getAttribute('data-sort');
+
+            // Toggle sort direction if clicking the same header again
+            let isDescending = true;
+            if (header.querySelector('.fa-sort-down')) {{
+                isDescending = false;
+            }}
+
+            // Reset all header icons
+            headers.forEach(h => {{
+                const icon = h.querySelector('i');
                 if (icon) {{
-                    icon.className = isDescending 
-                        ? 'fas fa-sort-down ml-1 text-blue-500' 
-                        : 'fas fa-sort-up ml-1 text-blue-500';
+                    icon.className = 'fas fa-sort ml-1 text-gray-400';
                 }}
-                
-                // Sort the table
-                sortTableByColumn(tbody, sortKey, isDescending);
             }});
+
+            // Update clicked header icon
+            const icon = header.querySelector('i');
+            if (icon) {{
+                icon.className = isDescending
+                    ? 'fas fa-sort-down ml-1 text-blue-500'
+                    : 'fas fa-sort-up ml-1 text-blue-500';
+            }}
+
+            // Sort the table
+            sortTableByColumn(tbody, sortKey, isDescending);
         }});
     }}
     
-    function sortTableByColumn(tbody, column, isDescending = true) {{
-        const rows = Array.from(tbody.querySelectorAll('tr'));
-        
-        // Sort rows based on the selected column
-        const sortedRows = rows.sort((a, b) => {{
-            const aValue = parseFloat(a.getAttribute(`data-${{column}}`)) || 0;
-            const bValue = parseFloat(b.getAttribute(`data-${{column}}`)) || 0;
-            
-            return isDescending ? bValue - aValue : aValue - bValue;
-        }});
-        
-        // Clear table body
-        while (tbody.firstChild) {{
-            tbody.removeChild(tbody.firstChild);
+    // Numeric sort keys per row, parsed from the data-* attributes on first use
+    const rowSortKeys = new WeakMap();
+
+    function rowSortKey(row, column) {{
+        let keys = rowSortKeys.get(row);
+        if (!keys) {{
+            keys = {{}};
+            rowSortKeys.set(row, keys);
         }}
-        
-        // Append sorted rows
-        sortedRows.forEach(row => {{
-            tbody.appendChild(row);
+        if (!(column in keys)) {{
+            keys[column] = parseFloat(row.getAttribute(`data-${{column}}`)) || 0;
+        }}
+        return keys[column];
+    }}
+
+    // Comparators over [key, row] pairs, created once rather than per sort
+    const byKeyAscending = (a, b) => a[0] - b[0];
+    const byKeyDescending = (a, b) => b[0] - a[0];
+
+    function sortTableByColumn(tbody, column, isDescending = true) {{
+        // Pair each row with its key once so the comparator only subtracts numbers
+        const keyedRows = [...tbody.rows].map(row => [rowSortKey(row, column), row]);
+        keyedRows.sort(isDescending ? byKeyDescending : byKeyAscending);
+
+        // Re-insert the rows in one DOM operation; appending a row moves it,
+        // so the tbody doesn't need clearing first
+        const fragment = document.createDocumentFragment();
+        keyedRows.forEach(([, row]) => {{
+            fragment.appendChild(row);
         }});
+        tbody.appendChild(fragment);
     }}
-</script>'''
+</script>''')
 
-    def _get_theme_javascript(self) -> str:
-        """Get the JavaScript for theme switching.
-        
-        Returns:
-            JavaScript code for theme switching
-        """
-        return '''
+# Theme switching script shared by every report
+_THEME_JAVASCRIPT = _minify_js('''
 <script>
     // Theme switching functionality
     document.addEventListener('DOMContentLoaded', function() {
@@ -1521,39 +1779,27 @@ class HTMLReportGenerator:
             html.classList.remove('dark');
         }
         
-        // Handle theme toggle button click
-        themeToggle.addEventListener('click', function() {
-            // Toggle theme
-            html.classList.toggle('dark');
-            
-            // Save preference
-            localStorage.setItem('theme', html.classList.contains('dark') ? 'dark' : 'light');
-            
-            // Update charts with theme-aware colors if they exist
-            if (window.chartInstances) {
-                Object.values(window.chartInstances).forEach(chart => {
-                    // Update colors that should change with theme
-                    if (chart.options.scales) {
-                        if (chart.options.scales.y) {
-                            chart.options.scales.y.grid.color = 'var(--border-color)';
-                            chart.options.scales.y.ticks.color = 'var(--text-secondary)';
-                            chart.options.scales.y.title.color = 'var(--text-primary)';
-                        }
-                        if (chart.options.scales.x) {
-                            chart.options.scales.x.grid.color = 'var(--border-color)';
-                            chart.options.scales.x.ticks.color = 'var(--text-secondary)';
-                            chart.options.scales.x.title.color = 'var(--text-primary)';
-                        }
-                    }
-                    
-                    if (chart.options.plugins && chart.options.plugins.legend) {
-                        chart.options.plugins.legend.labels.color = 'var(--text-primary)';
-                    }
-                    
-                    chart.update();
-                });
-            }
-        });
+        // Handle theme toggle button click; bind only once even if this script runs again
+        if (!themeToggle.dataset.bound) {
+            themeToggle.dataset.bound = '1';
+            themeToggle.addEventListener('click', function() {
+                // Toggle theme
+                html.classList.toggle('dark');
+                
+                // Save preference
+                localStorage.setItem('theme', html.classList.contains('dark') ? 'dark' : 'light');
+                
+                // Redraw the charts without animating. The canvas cannot resolve the
+                // CSS variables in CHART_COLORS, so Chart.js draws those texts and
+                // grid lines in its fallback color in both themes; reassigning them
+                // would change nothing, and the redraw has no visible effect on the
+                // colors. All charts redraw together in the next frame
+                if (window.chartInstances) {
+                    const charts = Object.values(window.chartInstances);
+                    requestAnimationFrame(() => charts.forEach(chart => chart.update('none')));
+                }
+            });
+        }
         
         // Listen for system theme changes
         window.matchMedia('(prefers-color-scheme: dark)').addEventListener('change', event => {
@@ -1566,10 +1812,207 @@ class HTMLReportGenerator:
             }
         });
     });
-</script>'''
+</script>''')
+
+# Document start up to the favicon link, the only per-report part of <head>
+_DOCUMENT_OPEN_FRAGMENTS = _split_at_slots(minify_html('''
+<!DOCTYPE html>
+<html lang="en" class="$theme">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>CodeLyzer - Advanced Code Analysis Report</title>
+    <link rel="icon" href="$favicon_path" type="image/png">'''), "theme", "favicon_path")
+
+# Everything in <head> after the favicon link is identical for every report
+_STATIC_HEAD = minify_html(_REPORT_HEAD_LINKS + _REPORT_STYLE)
+
+# Static markup between the dynamic sections of the report body
+_BODY_OPEN = '</head><body class="font-inter text-sm min-h-screen">'
+_CONTAINER_OPEN = '<div class="max-w-7xl mx-auto p-6">'
+_TABLES_OPEN = '<div class="grid grid-cols-1 lg:grid-cols-2 gap-6 mb-10 fade-in">'
+_TABLES_CLOSE = '</div>'
+_CONTAINER_CLOSE = '</div>'
+_DOCUMENT_CLOSE = '</body></html>'
+
+
+class HTMLReportGenerator:
+    """Generate HTML reports for codebase analysis metrics."""
+
+    def __init__(self) -> None:
+        """Initialize the HTML report generator."""
+        self._plot_generator = PlotReportGenerator()
+        self._default_theme = "light"
+
+    def create(self, metrics: 'ProjectMetrics', output_dir: str = "reports") -> str:
+        """Generate HTML report for the given metrics.
+        
+        Args:
+            metrics: ProjectMetrics object containing analysis data
+            output_dir: Directory to save the report and assets (default: reports)
+            
+        Returns:
+            Complete HTML report as a string
+        """
+        self._prepare_data(metrics)
+        
+        # Copy favicon to output directory
+        favicon_path = copy_favicon_to_output(output_dir)
+        
+        return self._build_html_template(metrics, favicon_path)
+
+    def create_to(self, metrics: 'ProjectMetrics', fp: TextIO, output_dir: str = "reports") -> None:
+        """Generate the HTML report and write it straight to an open text file.
+
+        Each report section is rendered and written before the next one is
+        built, so the full document is never held in memory at once.
+
+        Args:
+            metrics: ProjectMetrics object containing analysis data
+            fp: Text file object to write the report to
+            output_dir: Directory to save the report and assets (default: reports)
+        """
+        self._prepare_data(metrics)
+
+        # Copy favicon to output directory
+        favicon_path = copy_favicon_to_output(output_dir)
+
+        fp.writelines(self._build_html_parts(metrics, favicon_path))
+
+    def create_compressed(self, metrics: 'ProjectMetrics', output_dir: str = "reports",
+                          algo: CompressionType = "gzip") -> bytes:
+        """Generate the HTML report precompressed for serving with a Content-Encoding header.
+
+        Args:
+            metrics: ProjectMetrics object containing analysis data
+            output_dir: Directory to save the report and assets (default: reports)
+            algo: Compression to apply, "gzip" or "br" (default: gzip)
+
+        Returns:
+            Compressed UTF-8 encoded HTML report
+
+        Raises:
+            ValueError: If the compression algorithm is not supported
+            ImportError: If brotli compression is requested but brotli is not installed
+        """
+        if algo not in ("gzip", "br"):
+            raise ValueError(f"Unsupported compression algorithm: {algo}")
+        if algo == "br" and not BROTLI_AVAILABLE:
+            raise ImportError("brotli compression requires the 'brotli' package")
+
+        html = self.create(metrics, output_dir).encode("utf-8")
+        if algo == "br":
+            return brotli.compress(html, quality=5)
+        return gzip.compress(html, compresslevel=6)
+
+    def _prepare_data(self, metrics: 'ProjectMetrics') -> None:
+        """Prepare all data components for the HTML template.
+        
+        Args:
+            metrics: ProjectMetrics object containing analysis data
+        """
+        self._plot_generator.prepare_chart_data(metrics)
+
+    def _build_html_template(self, metrics: 'ProjectMetrics', favicon_path: str = "") -> str:
+        """Build the complete HTML template for the report.
+        
+        Args:
+            metrics: ProjectMetrics object containing analysis data
+            favicon_path: Path to the favicon file
+            
+        Returns:
+            Complete HTML report as a string
+        """
+        return "".join(self._build_html_parts(metrics, favicon_path))
+
+    def _build_html_parts(self, metrics: 'ProjectMetrics', favicon_path: str = "") -> Iterator[str]:
+        """Build the report as an ordered stream of HTML fragments.
+
+        Each section is rendered only when the previous fragments have been
+        consumed, so a caller writing them out never holds the whole report.
+
+        Args:
+            metrics: ProjectMetrics object containing analysis data
+            favicon_path: Path to the favicon file
+
+        Yields:
+            HTML fragments which, concatenated, form the complete report
+        """
+        # Read the clock once so the header timestamp and footer year always agree
+        now = datetime.now()
+
+        document_open = _DOCUMENT_OPEN_FRAGMENTS
+        yield document_open[0]
+        yield self._default_theme
+        yield document_open[1]
+        yield favicon_path
+        yield document_open[2]
+        yield _STATIC_HEAD
+        yield _BODY_OPEN
+        yield ThemeToggleComponent.render(metrics)
+        yield _CONTAINER_OPEN
+        yield HeaderComponent.render(metrics, format_timestamp(now))
+        yield MetricsGridComponent.render(metrics)
+        yield self._plot_generator.get_charts_grid_html()
+        yield _TABLES_OPEN
+        yield ComplexFilesTableComponent.render(metrics)
+        yield DependenciesTableComponent.render(metrics)
+        yield _TABLES_CLOSE
+        yield FooterComponent.render(metrics, now.year)
+        yield _CONTAINER_CLOSE
+        yield self._get_chart_data_html(self._plot_generator.charts_data)
+        yield self._get_javascript()
+        yield self._get_theme_javascript()
+        yield _DOCUMENT_CLOSE
+
+    @staticmethod
+    def _get_chart_data_html(charts_data: Dict[str, Dict[str, Any]]) -> str:
+        """Get the JSON data block holding the chart data.
+
+        The data is emitted as a non-executable ``application/json`` script so
+        the browser hands it to its native JSON parser instead of the JS parser.
+
+        Args:
+            charts_data: Prepared chart data, keyed by chart id
+
+        Returns:
+            HTML script element containing the chart data as JSON
+        """
+        # Escape "</" so a label can never close the script element early
+        chart_data_json = _dumps(charts_data).replace("</", "<\\/")
+        return f'<script type="application/json" id="chart-data">{chart_data_json}</script>'
+
+    def _get_javascript(self) -> str:
+        """Get the JavaScript section for charts and animations.
+        
+        Returns:
+            JavaScript code for the report
+        """
+        return _CHART_JAVASCRIPT
+
+    def _get_theme_javascript(self) -> str:
+        """Get the JavaScript for theme switching.
+        
+        Returns:
+            JavaScript code for theme switching
+        """
+        return _THEME_JAVASCRIPT
 
 
 def generate_direct_html(metrics: 'ProjectMetrics', output_dir: str = "reports") -> str:
     """Generate HTML directly without using format strings to avoid issues"""
     generator = HTMLReportGenerator()
     return generator.create(metrics, output_dir)
+
+
+def write_direct_html(metrics: 'ProjectMetrics', fp: TextIO, output_dir: str = "reports") -> None:
+    """Generate the HTML report and stream it to an open text file"""
+    generator = HTMLReportGenerator()
+    generator.create_to(metrics, fp, output_dir)
+
+
+def generate_direct_html_gz(metrics: 'ProjectMetrics', output_dir: str = "reports",
+                            algo: CompressionType = "gzip") -> bytes:
+    """Generate the HTML report precompressed with gzip (or brotli), ready to ship as .html.gz"""
+    generator = HTMLReportGenerator()
+    return generator.create_compressed(metrics, output_dir, algo)
@@ -1,7 +1,29 @@
-from typing import Any, Dict
+import re
+from typing import Any, Dict, List, Tuple
 
 from codelyzer.metrics import FileMetrics, ProjectMetrics, MetricProvider, CodeSmellSeverity
 
+# Patterns for the regex-based smell checks, compiled once at import time
+_PYTHON_FUNCTION_PATTERN = re.compile(r"def\s+(\w+)\s*\(")
+# JavaScript function styles, in the order their functions are reported
+_JS_FUNCTION_STYLES = ('declaration', 'expression', 'arrow', 'method')
+_JS_FUNCTION_STYLE_RANKS = {style: rank for rank, style in enumerate(_JS_FUNCTION_STYLES)}
+# One alternative per style, each spanning the declaration in a group named after
+# the style and the function name in "<style>_name". The lookahead tries every
+# position, so declarations nested inside another style's match are still found.
+_JS_FUNCTION_PATTERN = re.compile(
+    r"(?=(?P<declaration>function\s+(?P<declaration_name>\w+)\s*\([^)]*\)\s*{)"  # function name() {}
+    r"|(?P<expression>(?:const|let|var)\s+(?P<expression_name>\w+)\s*=\s*function\s*\([^)]*\)\s*{)"  # const name = function() {}
+    r"|(?P<arrow>(?:const|let|var)\s+(?P<arrow_name>\w+)\s*=\s*\([^)]*\)\s*=>\s*{)"  # const name = () => {}
+    r"|(?P<method>(?P<method_name>\w+)\s*:\s*function\s*\([^)]*\)\s*{))"  # name: function() {}
+)
+_WILDCARD_IMPORT_PATTERN = re.compile(r"from\s+\w+\s+import\s+\*")
+_BROAD_EXCEPT_PATTERN = re.compile(r"except\s*:")
+_MUTABLE_DEFAULT_PATTERN = re.compile(r"def\s+\w+\s*\([^)]*=\s*(\[\]|\{\}|\(\)|\{\s*:\s*\}|\[\s*\]|\(\s*\))[^)]*\)")
+_CONSOLE_PATTERN = re.compile(r"console\.(log|warn|error|info|debug)\(")
+_ALERT_PATTERN = re.compile(r"\b(alert|prompt|confirm)\(")
+_LOOSE_EQUALITY_PATTERN = re.compile(r"[^=!]=(?!=)[^=]")
+
 
 class CodeSmellAnalyzer(MetricProvider):
     """Analyzer for identifying code smells in projects"""
@@ -82,11 +104,8 @@ class CodeSmellAnalyzer(MetricProvider):
 
     def _check_python_function_length(self, file_metrics: FileMetrics, file_content: str) -> None:
         """Check for overly long Python functions"""
-        import re
-
         # Find Python function definitions
-        func_pattern = r"def\s+(\w+)\s*\("
-        functions = re.finditer(func_pattern, file_content)
+        functions = _PYTHON_FUNCTION_PATTERN.finditer(file_content)
 
         for match in functions:
             func_name = match.group(1)
@@ -125,35 +144,38 @@ class CodeSmellAnalyzer(MetricProvider):
 
     def _check_js_function_length(self, file_metrics: FileMetrics, file_content: str) -> None:
         """Check for overly long JavaScript/TypeScript functions"""
-        import re
-
-        # Define patterns for different function declaration styles
-        func_patterns = self._get_js_function_patterns()
-
-        for pattern in func_patterns:
-            functions = re.finditer(pattern, file_content)
-
-            for match in functions:
-                func_name = match.group(1)
-                func_start = match.start()
-                line_count = self._count_js_function_lines(file_content[func_start:])
+        for func_start, func_name in self._find_js_functions(file_content):
+            line_count = self._count_js_function_lines(file_content[func_start:])
 
-                self._report_function_length_issues(
-                    file_metrics,
-                    func_name,
-                    line_count,
-                    self._get_line_number(file_content, func_start)
-                )
+            self._report_function_length_issues(
+                file_metrics,
+                func_name,
+                line_count,
+                self._get_line_number(file_content, func_start)
+            )
 
     @staticmethod
-    def _get_js_function_patterns() -> list[str]:
-        """Get regex patterns for different JavaScript function styles"""
-        return [
-            r"function\s+(\w+)\s*\([^)]*\)\s*{",  # function name() {}
-            r"(?:const|let|var)\s+(\w+)\s*=\s*function\s*\([^)]*\)\s*{",  # const name = function() {}
-            r"(?:const|let|var)\s+(\w+)\s*=\s*\([^)]*\)\s*=>\s*{",  # const name = () => {}
-            r"(\w+)\s*:\s*function\s*\([^)]*\)\s*{",  # name: function() {}
-        ]
+    def _find_js_functions(file_content: str) -> List[Tuple[int, str]]:
+        """Find JavaScript function declarations of every style in a single scan
+
+        Matches are the same, and come in the same order, as scanning the file
+        once per style: grouped by style, in source order within each style.
+        """
+        functions = []
+        next_start = dict.fromkeys(_JS_FUNCTION_STYLES, 0)
+
+        for match in _JS_FUNCTION_PATTERN.finditer(file_content):
+            # The styles never match at the same position; the outer group names the one that did
+            style = match.lastgroup
+            func_start = match.start()
+            # A separate scan per style would resume after its previous match
+            if func_start < next_start[style]:
+                continue
+            next_start[style] = match.end(style)
+            functions.append((_JS_FUNCTION_STYLE_RANKS[style], func_start, match.group(f"{style}_name")))
+
+        functions.sort()
+        return [(func_start, func_name) for _, func_start, func_name in functions]
 
     @staticmethod
     def _count_js_function_lines(function_text: str) -> int:
@@ -314,11 +336,8 @@ class CodeSmellAnalyzer(MetricProvider):
 
     def _check_python_smells(self, file_metrics: FileMetrics, file_content: str, ast_data: Any) -> None:
         """Check for Python-specific code smells"""
-        import re
-
         # Check for wildcard imports
-        wildcard_pattern = r"from\s+\w+\s+import\s+\*"
-        matches = re.finditer(wildcard_pattern, file_content)
+        matches = _WILDCARD_IMPORT_PATTERN.finditer(file_content)
         for match in matches:
             location = self._get_line_number(file_content, match.start())
             self._add_code_smell(
@@ -330,8 +349,7 @@ class CodeSmellAnalyzer(MetricProvider):
             )
 
         # Check for excessive exception catching
-        broad_except_pattern = r"except\s*:"
-        matches = re.finditer(broad_except_pattern, file_content)
+        matches = _BROAD_EXCEPT_PATTERN.finditer(file_content)
         for match in matches:
             location = self._get_line_number(file_content, match.start())
             self._add_code_smell(
@@ -343,8 +361,7 @@ class CodeSmellAnalyzer(MetricProvider):
             )
 
         # Check for mutable default arguments
-        mutable_defaults_pattern = r"def\s+\w+\s*\([^)]*=\s*(\[\]|\{\}|\(\)|\{\s*:\s*\}|\[\s*\]|\(\s*\))[^)]*\)"
-        matches = re.finditer(mutable_defaults_pattern, file_content)
+        matches = _MUTABLE_DEFAULT_PATTERN.finditer(file_content)
         for match in matches:
             location = self._get_line_number(file_content, match.start())
             self._add_code_smell(
@@ -357,11 +374,8 @@ class CodeSmellAnalyzer(MetricProvider):
 
     def _check_js_smells(self, file_metrics: FileMetrics, file_content: str, ast_data: Any) -> None:
         """Check for JavaScript-specific code smells"""
-        import re
-
         # Check for console.log statements
-        console_pattern = r"console\.(log|warn|error|info|debug)\("
-        matches = re.finditer(console_pattern, file_content)
+        matches = _CONSOLE_PATTERN.finditer(file_content)
         for match in matches:
             location = self._get_line_number(file_content, match.start())
             self._add_code_smell(
@@ -373,8 +387,7 @@ class CodeSmellAnalyzer(MetricProvider):
             )
 
         # Check for alert/prompt usage
-        alert_pattern = r"\b(alert|prompt|confirm)\("
-        matches = re.finditer(alert_pattern, file_content)
+        matches = _ALERT_PATTERN.finditer(file_content)
         for match in matches:
             location = self._get_line_number(file_content, match.start())
             self._add_code_smell(
@@ -386,8 +399,7 @@ class CodeSmellAnalyzer(MetricProvider):
             )
 
         # Check for == instead of ===
-        equality_pattern = r"[^=!]=(?!=)[^=]"
-        matches = re.finditer(equality_pattern, file_content)
+        matches = _LOOSE_EQUALITY_PATTERN.finditer(file_content)
         for match in matches:
             location = self._get_line_number(file_content, match.start())
             self._add_code_smell(
@@ -6,7 +6,7 @@ from rich import box
 from rich.panel import Panel
 from rich.table import Table
 
-from codelyzer._html import generate_direct_html
+from codelyzer._html import write_direct_html
 from codelyzer.config import LANGUAGE_CONFIGS
 from codelyzer.console import (
     console, create_summary_panel, display_initial_info, display_final_summary,
@@ -46,12 +46,9 @@ def generate_reports(metrics, output_format: str, output_dir: str, project_path:
         html_file = output_path / f"{project_path.name}_analysis.html"
         logger.info(f"Generating HTML report: {html_file}")
 
-        # Generate HTML content using our direct method and pass the output directory
-        html_content = generate_direct_html(metrics, str(output_path))
-
-        # Write to file
+        # Stream the HTML report straight into the file, passing the output directory for assets
         with open(html_file, 'w', encoding='utf-8') as f:
-            f.write(html_content)
+            write_direct_html(metrics, f, str(output_path))
 
         logger.info(f"HTML report saved to {html_file}")
         console.print(f"[green]✅ HTML report saved:[/green] [link]{html_file}[/link]")
@@ -1,6 +1,8 @@
+import heapq
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from enum import StrEnum, auto
+from operator import attrgetter
 from typing import Dict, List, Any, Optional
 
 
@@ -400,6 +402,10 @@ class ProjectMetrics:
         """Get the language distribution dictionary"""
         return self.base.languages
 
+    def top_complex_files(self, k: int = 15) -> List[FileMetrics]:
+        """Get the k most complex files, ordered by descending complexity score"""
+        return heapq.nlargest(k, self.file_metrics, key=attrgetter('complexity_score'))
+
     def add_custom_metric(self, name: str, value: Any) -> None:
         """Add a custom metric"""
         self.custom_metrics[name] = value
@@ -0,0 +1,27 @@
+import pytest
+
+from codelyzer.metrics import create_file_metrics, create_project_metrics
+
+
+def _make_metrics(scores=(), issues=(), smells=(), languages=None):
+    """Build a ProjectMetrics with one Python file per complexity score.
+
+    The security issues go to the first file and the code smells to the last.
+    """
+    metrics = create_project_metrics()
+    for i, score in enumerate(scores):
+        file_metric = create_file_metrics(f'mod_{i}.py', 'python')
+        file_metric.complexity.complexity_score = score
+        metrics.file_metrics.append(file_metric)
+    if metrics.file_metrics:
+        metrics.file_metrics[0].security.vulnerabilities.extend(issues)
+        metrics.file_metrics[-1].code_smells.smells.extend(smells)
+    if languages is not None:
+        metrics.base.languages = dict(languages)
+    return metrics
+
+
+@pytest.fixture
+def make_metrics():
+    """Factory fixture building ProjectMetrics from complexity scores, issues and smells"""
+    return _make_metrics
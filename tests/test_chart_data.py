@@ -0,0 +1,150 @@
+import random
+
+import pytest
+
+from codelyzer._html import (
+    CodeSmellsChartData,
+    ComplexityChartData,
+    LanguageChartData,
+    SecurityIssuesChartData,
+    _aggregate_counts,
+)
+from codelyzer.metrics import SecurityLevel, create_project_metrics
+
+
+def _reference_complexity(metrics):
+    """Per-file complexity bucketing as the complexity chart used to do it"""
+    counts = {"Low": 0, "Medium": 0, "High": 0, "Very High": 0}
+    for file_metric in metrics.file_metrics:
+        score = file_metric.complexity_score
+        if score < 10:
+            counts["Low"] += 1
+        elif score < 20:
+            counts["Medium"] += 1
+        elif score < 30:
+            counts["High"] += 1
+        else:
+            counts["Very High"] += 1
+    return counts
+
+
+def _reference_security(metrics):
+    """Per-issue severity bucketing as the security chart used to do it"""
+    counts = {"Critical": 0, "High": 0, "Medium": 0, "Low": 0}
+    for file_metric in metrics.file_metrics:
+        for issue in file_metric.security_issues:
+            level = issue.get('level', SecurityLevel.MEDIUM_RISK)
+            severity = issue.get('severity', 'medium').lower()
+            if level == SecurityLevel.CRITICAL or severity == 'critical':
+                counts["Critical"] += 1
+            elif level == SecurityLevel.HIGH_RISK or severity == 'high':
+                counts["High"] += 1
+            elif level == SecurityLevel.MEDIUM_RISK or severity == 'medium':
+                counts["Medium"] += 1
+            else:
+                counts["Low"] += 1
+    return counts
+
+
+def _reference_smells(metrics):
+    """Per-smell severity bucketing as the code smells chart used to do it"""
+    counts = {"Critical": 0, "Major": 0, "Minor": 0}
+    for file_metric in metrics.file_metrics:
+        for smell in file_metric.code_smells_list:
+            severity = smell.get('severity', 'minor').lower()
+            if severity == 'critical':
+                counts["Critical"] += 1
+            elif severity == 'major':
+                counts["Major"] += 1
+            else:
+                counts["Minor"] += 1
+    return counts
+
+
+def _assert_matches_reference(metrics):
+    counts = _aggregate_counts(metrics)
+    assert counts["complexity"] == _reference_complexity(metrics)
+    assert counts["security"] == _reference_security(metrics)
+    assert counts["code_smells"] == _reference_smells(metrics)
+
+
+@pytest.mark.parametrize("score", [0, 9.999, 10, 10.0001, 19.999, 20, 29.999, 30, 30.5, 1000, -1, float('nan')])
+def test_complexity_bucket_boundaries(make_metrics, score):
+    _assert_matches_reference(make_metrics([score]))
+
+
+@pytest.mark.parametrize("issue", [
+    {},
+    {'level': SecurityLevel.CRITICAL},
+    {'level': SecurityLevel.HIGH_RISK, 'severity': 'low'},
+    {'level': SecurityLevel.LOW_RISK, 'severity': 'CRITICAL'},
+    {'level': SecurityLevel.LOW_RISK, 'severity': 'High'},
+    {'level': SecurityLevel.LOW_RISK},
+    {'level': SecurityLevel.SECURE, 'severity': 'low'},
+    {'level': 'critical', 'severity': 'low'},
+    {'level': 'unknown-level', 'severity': 'unknown-severity'},
+    {'severity': 'weird'},
+])
+def test_security_buckets_including_unknown_severities(make_metrics, issue):
+    _assert_matches_reference(make_metrics([1], issues=[issue]))
+
+
+@pytest.mark.parametrize("smell", [
+    {},
+    {'severity': 'critical'},
+    {'severity': 'Major'},
+    {'severity': 'MINOR'},
+    {'severity': 'none'},
+    {'severity': 'unknown'},
+])
+def test_smell_buckets_including_unknown_severities(make_metrics, smell):
+    _assert_matches_reference(make_metrics([1], smells=[smell]))
+
+
+def test_random_projects_match_per_chart_loops(make_metrics):
+    rng = random.Random(1234)
+    levels = list(SecurityLevel) + ['bogus']
+    severities = ['critical', 'high', 'medium', 'low', 'HIGH', 'Critical', 'unknown']
+    smell_severities = ['critical', 'major', 'minor', 'Major', 'none', 'unknown']
+    for _ in range(20):
+        metrics = make_metrics([rng.choice([rng.uniform(0, 40), 10, 20, 30]) for _ in range(30)])
+        for file_metric in metrics.file_metrics:
+            for _ in range(rng.randint(0, 3)):
+                issue = {}
+                if rng.random() < 0.8:
+                    issue['level'] = rng.choice(levels)
+                if rng.random() < 0.8:
+                    issue['severity'] = rng.choice(severities)
+                file_metric.security.vulnerabilities.append(issue)
+            for _ in range(rng.randint(0, 3)):
+                smell = {'severity': rng.choice(smell_severities)} if rng.random() < 0.8 else {}
+                file_metric.code_smells.smells.append(smell)
+        _assert_matches_reference(metrics)
+
+
+def test_empty_project_counts_are_zero():
+    counts = _aggregate_counts(create_project_metrics())
+    assert set(counts["complexity"].values()) == {0}
+    assert set(counts["security"].values()) == {0}
+    assert set(counts["code_smells"].values()) == {0}
+
+
+def test_chart_classes_accept_precomputed_counts(make_metrics):
+    metrics = make_metrics([5, 15, 25, 35], issues=[{'severity': 'high'}], smells=[{'severity': 'major'}],
+                           languages={'python': 3, 'rust': 7})
+    counts = _aggregate_counts(metrics)
+    for chart_class in (LanguageChartData, ComplexityChartData, SecurityIssuesChartData, CodeSmellsChartData):
+        assert chart_class.prepare_data(metrics, counts) == chart_class.prepare_data(metrics)
+    assert LanguageChartData.prepare_data(metrics, counts) == {"labels": ['rust', 'python'], "values": [7, 3]}
+
+
+def test_severity_charts_expose_colors_as_fresh_lists(make_metrics):
+    metrics = make_metrics([1])
+    for chart_class in (SecurityIssuesChartData, CodeSmellsChartData):
+        first = chart_class.prepare_data(metrics)
+        second = chart_class.prepare_data(metrics)
+        assert isinstance(first["colors"], list)
+        assert len(first["colors"]) == len(first["labels"])
+        # Mutating one chart's colors must not leak into the shared palette
+        first["colors"].append("#000000")
+        assert second["colors"] == chart_class.prepare_data(metrics)["colors"]
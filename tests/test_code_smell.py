@@ -0,0 +1,44 @@
+import re
+
+import pytest
+
+from codelyzer.analyzers.code_smell import CodeSmellAnalyzer
+
+# The function patterns as they were scanned before, one finditer pass each
+_PER_STYLE_PATTERNS = (
+    r"function\s+(\w+)\s*\([^)]*\)\s*{",
+    r"(?:const|let|var)\s+(\w+)\s*=\s*function\s*\([^)]*\)\s*{",
+    r"(?:const|let|var)\s+(\w+)\s*=\s*\([^)]*\)\s*=>\s*{",
+    r"(\w+)\s*:\s*function\s*\([^)]*\)\s*{",
+)
+
+
+def _scan_per_style(content):
+    return [(match.start(), match.group(1))
+            for pattern in _PER_STYLE_PATTERNS
+            for match in re.finditer(pattern, content)]
+
+
+@pytest.mark.parametrize("content", [
+    "",
+    "function plain(a, b) {\n  return a + b;\n}\n",
+    "const f = function() {\n};\nlet g = function (x) { return x; };\n",
+    "const f = function named() {\n};\n",
+    "const arrow = () => {\n};\nvar withArgs = (a, b) => {\n  return a;\n};\n",
+    "const obj = {\n  method: function() {\n  },\n  other: function named() {}\n};\n",
+    "var outer = function(cb = function inner() {}) {\n};\n",
+    "const outer = (a = function inner(b) {}) => {\n};\n",
+    "abc: function() {}\nxyz:function(){}\n",
+    "function a() {} function b() {}\nconst c = () => {}\nfunction d() {}\n",
+    "const notAFunction = 42;\nlet alsoNot = (1 + 2);\n",
+])
+def test_find_js_functions_matches_per_style_scans(content):
+    assert CodeSmellAnalyzer._find_js_functions(content) == _scan_per_style(content)
+
+
+def test_find_js_functions_reports_by_style_then_source_order():
+    content = "const late = () => {}\nfunction early() {}\nfunction later() {}\n"
+
+    names = [name for _, name in CodeSmellAnalyzer._find_js_functions(content)]
+
+    assert names == ['early', 'later', 'late']
@@ -0,0 +1,130 @@
+import gzip
+import io
+import json
+
+import pytest
+
+from codelyzer._html import (
+    _FAVICON_SOURCE,
+    HTMLReportGenerator,
+    PlotReportGenerator,
+    copy_favicon_to_output,
+    generate_direct_html_gz,
+)
+from codelyzer.metrics import create_file_metrics, create_project_metrics
+
+
+@pytest.fixture
+def metrics(make_metrics):
+    return make_metrics([12.5], languages={'python': 1})
+
+
+def test_report_is_self_contained(metrics, tmp_path):
+    html = HTMLReportGenerator().create(metrics, str(tmp_path))
+
+    assert 'assets/static/report.css' not in html
+    assert 'tailwind-config.js' not in html
+    assert 'tailwind.config' in html
+    assert '.stat-card' in html
+    assert not (tmp_path / 'assets' / 'static' / 'report.css').exists()
+
+
+def test_compressed_report_is_self_contained(metrics, tmp_path):
+    html = gzip.decompress(generate_direct_html_gz(metrics, str(tmp_path))).decode('utf-8')
+
+    assert 'tailwind.config' in html
+    assert '.stat-card' in html
+    assert 'assets/static/report.css' not in html
+
+
+def test_favicon_is_copied_and_refreshed_when_replaced(tmp_path):
+    relative_path = copy_favicon_to_output(str(tmp_path))
+    dest = tmp_path / relative_path
+    assert dest.read_bytes() == _FAVICON_SOURCE.read_bytes()
+
+    # A different favicon of the same size must still be replaced
+    source = _FAVICON_SOURCE.read_bytes()
+    dest.write_bytes(bytes(b ^ 0xFF for b in source))
+    assert dest.stat().st_size == len(source)
+
+    copy_favicon_to_output(str(tmp_path))
+    assert dest.read_bytes() == source
+
+
+def _embedded_chart_data(html):
+    start = html.index('<script type="application/json" id="chart-data">')
+    start = html.index('>', start) + 1
+    return json.loads(html[start:html.index('</script>', start)])
+
+
+def test_empty_project_embeds_no_chart_data(tmp_path):
+    generator = HTMLReportGenerator()
+    html = generator.create(create_project_metrics(), str(tmp_path))
+
+    assert generator._plot_generator.charts_data == {}
+    assert _embedded_chart_data(html) == {}
+    # The chart cards stay in the markup; the report script removes the ones without data
+    for chart_id in ('languages', 'complexity', 'security', 'code_smells'):
+        assert f'id="chart-{chart_id}"' in html
+
+
+def test_project_without_smells_or_vulnerabilities_skips_those_charts(metrics, tmp_path):
+    generator = HTMLReportGenerator()
+    html = generator.create(metrics, str(tmp_path))
+
+    chart_data = _embedded_chart_data(html)
+    assert set(chart_data) == {'languages', 'complexity'}
+    assert chart_data['complexity']['values'] == [0, 1, 0, 0]
+
+
+def test_reused_generator_drops_charts_that_became_empty(metrics):
+    plot_generator = PlotReportGenerator()
+    metrics.file_metrics[0].security.vulnerabilities.append({'severity': 'high'})
+    plot_generator.prepare_chart_data(metrics)
+    assert 'security' in plot_generator.charts_data
+
+    metrics.file_metrics[0].security.vulnerabilities.clear()
+    plot_generator.prepare_chart_data(metrics)
+    assert 'security' not in plot_generator.charts_data
+
+
+def test_reused_generator_restores_deleted_favicon(metrics, tmp_path):
+    generator = HTMLReportGenerator()
+    generator.create(metrics, str(tmp_path))
+    favicon = tmp_path / 'assets' / 'static' / 'favicon.png'
+    favicon.unlink()
+
+    generator.create(metrics, str(tmp_path))
+    assert favicon.read_bytes() == _FAVICON_SOURCE.read_bytes()
+
+
+def test_reused_generator_renders_updated_metrics_grid(metrics, tmp_path):
+    generator = HTMLReportGenerator()
+    metrics.base.total_files = 1234
+    assert '1,234' in generator.create(metrics, str(tmp_path))
+
+    metrics.base.total_files = 5678
+    html = generator.create(metrics, str(tmp_path))
+    assert '5,678' in html
+    assert '1,234' not in html
+
+
+def test_streamed_report_matches_created_report(metrics, tmp_path):
+    generator = HTMLReportGenerator()
+    fp = io.StringIO()
+    generator.create_to(metrics, fp, str(tmp_path))
+    streamed = fp.getvalue()
+
+    assert streamed.endswith('</body></html>')
+    assert _embedded_chart_data(streamed) == _embedded_chart_data(generator.create(metrics, str(tmp_path)))
+
+
+def test_compressed_report_keeps_non_ascii_project_data(tmp_path):
+    metrics = create_project_metrics()
+    metrics.file_metrics.append(create_file_metrics('paquete/módulo_数据.py', 'python'))
+    metrics.base.languages = {'pythön': 1}
+
+    html = gzip.decompress(generate_direct_html_gz(metrics, str(tmp_path))).decode('utf-8')
+
+    assert 'módulo_数据.py' in html
+    assert _embedded_chart_data(html)['languages']['labels'] == ['pythön']
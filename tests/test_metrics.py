@@ -0,0 +1,41 @@
+from codelyzer.metrics import create_project_metrics
+
+
+def _paths(files):
+    return [file_metric.file_path for file_metric in files]
+
+
+def test_top_complex_files_orders_by_descending_score(make_metrics):
+    metrics = make_metrics([3, 42, 7, 19, 0.5])
+
+    assert _paths(metrics.top_complex_files(3)) == ['mod_1.py', 'mod_3.py', 'mod_2.py']
+
+
+def test_top_complex_files_with_k_larger_than_file_count(make_metrics):
+    metrics = make_metrics([5, 1, 9])
+
+    assert _paths(metrics.top_complex_files(10)) == ['mod_2.py', 'mod_0.py', 'mod_1.py']
+
+
+def test_top_complex_files_keeps_file_order_for_ties(make_metrics):
+    metrics = make_metrics([10, 20, 10, 20, 10])
+
+    assert _paths(metrics.top_complex_files(4)) == ['mod_1.py', 'mod_3.py', 'mod_0.py', 'mod_2.py']
+    # Same result as a full stable sort, which is what callers relied on before
+    expected = sorted(metrics.file_metrics, key=lambda f: f.complexity_score, reverse=True)[:4]
+    assert metrics.top_complex_files(4) == expected
+
+
+def test_top_complex_files_on_empty_project():
+    metrics = create_project_metrics()
+
+    assert metrics.top_complex_files() == []
+    assert metrics.top_complex_files(0) == []
+
+
+def test_top_complex_files_defaults_to_fifteen(make_metrics):
+    metrics = make_metrics(range(20))
+
+    top = metrics.top_complex_files()
+    assert len(top) == 15
+    assert top[0].complexity_score == 19